@@ -1,6 +1,7 @@
 """Configuration management for Neural Express."""
 
 import os
+import json
 from pathlib import Path
 from typing import Any, Optional
 import yaml
@@ -13,6 +14,12 @@ logger = get_logger("config")
 # Load environment variables
 load_dotenv()
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 class Settings:
     """Application settings manager."""
@@ -39,17 +46,49 @@ class Settings:
         self._validate()
 
     def _load_config(self, config_path: Path) -> dict:
-        """Load configuration from YAML file."""
+        """
+        Load configuration from YAML file.
+
+        The parsed config is cached in a JSON sidecar next to the YAML file
+        and reused while it is at least as new as the YAML source.
+        """
         if not config_path.exists():
             logger.error(f"Config file not found: {config_path}")
             raise FileNotFoundError(f"Config file not found: {config_path}")
 
+        json_path = config_path.with_suffix(config_path.suffix + ".json")
+
+        if (
+            json_path.exists()
+            and json_path.stat().st_mtime >= config_path.stat().st_mtime
+        ):
+            with open(json_path, "r", encoding="utf-8") as f:
+                config = json.load(f)
+
+            logger.info(f"Loaded cached config from {json_path}")
+            return config
+
         with open(config_path, "r") as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=_YamlLoader)
+
+        self._write_config_cache(config, json_path)
 
         logger.info(f"Loaded config from {config_path}")
         return config
 
+    def _write_config_cache(self, config: dict, json_path: Path) -> None:
+        """Atomically write parsed config to its JSON sidecar."""
+        tmp_path = json_path.with_suffix(f".tmp{os.getpid()}")
+
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(config, f)
+            os.replace(tmp_path, json_path)
+        except (OSError, TypeError, ValueError) as e:
+            # Cache is an optimization only; a read-only install dir is fine
+            logger.debug(f"Could not write config cache {json_path}: {e}")
+            tmp_path.unlink(missing_ok=True)
+
     def _validate(self) -> None:
         """Validate required settings."""
         if not self.openai_api_key:
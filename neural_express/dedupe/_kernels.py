@@ -0,0 +1,119 @@
+"""Numba-compiled kernels for pairwise deduplication."""
+
+import numpy as np
+from numba import njit, prange
+
+# Rows per tile; a 128 x 384 float32 tile (~200KB) stays cache-resident
+TILE_SIZE = 128
+
+
+@njit(fastmath=True, cache=True)
+def _dot(a: np.ndarray, b: np.ndarray) -> float:
+    """Inner product of two 1-D vectors."""
+    total = 0.0
+    for k in range(a.shape[0]):
+        total += a[k] * b[k]
+    return total
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _scan_tiles(
+    emb: np.ndarray,
+    days: np.ndarray,
+    thr: float,
+    chain_thr: float,
+    tile: int,
+    dup_cursor: np.ndarray,
+    chain_cursor: np.ndarray,
+    dup_pairs: np.ndarray,
+    chain_pairs: np.ndarray,
+    write: bool
+) -> None:
+    """
+    Scan the upper triangle tile by tile, counting or writing pairs.
+
+    Each parallel task owns one block of rows and walks the column blocks
+    to its right, so a row's cursors are only ever touched by one thread.
+
+    Args:
+        emb: Unit-length float32 embeddings (shape: [n, dimension])
+        days: Publication day of each item (shape: [n])
+        thr: Similarity threshold for same-day duplicates
+        chain_thr: Similarity threshold for multi-day story chains
+        tile: Rows per tile
+        dup_cursor: Per-row duplicate count, or write offset when writing
+        chain_cursor: Per-row chain count, or write offset when writing
+        dup_pairs: Output duplicate pairs (ignored unless writing)
+        chain_pairs: Output chain pairs (ignored unless writing)
+        write: If True, write pairs at the cursors; otherwise only count
+    """
+    n = emb.shape[0]
+    n_tiles = (n + tile - 1) // tile
+
+    for ib in prange(n_tiles):
+        i0 = ib * tile
+        i1 = min(i0 + tile, n)
+        for j0 in range(i0, n, tile):
+            j1 = min(j0 + tile, n)
+            for i in range(i0, i1):
+                for j in range(max(i + 1, j0), j1):
+                    s = _dot(emb[i], emb[j])
+                    if s >= thr:
+                        if days[i] == days[j]:
+                            if write:
+                                dup_pairs[dup_cursor[i], 0] = i
+                                dup_pairs[dup_cursor[i], 1] = j
+                            dup_cursor[i] += 1
+                    elif s >= chain_thr and days[i] != days[j]:
+                        if write:
+                            chain_pairs[chain_cursor[i], 0] = i
+                            chain_pairs[chain_cursor[i], 1] = j
+                        chain_cursor[i] += 1
+
+
+def dedupe_pairs(
+    emb: np.ndarray,
+    days: np.ndarray,
+    thr: float,
+    chain_thr: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Find duplicate and story-chain pairs in one fused pass.
+
+    Pairs are counted per row in a first tiled pass, then written into
+    preallocated arrays at each row's offset in a second, so no pairwise
+    similarity matrix is ever materialized.
+
+    Args:
+        emb: Unit-length float32 embeddings (shape: [n, dimension])
+        days: Publication day of each item (shape: [n])
+        thr: Similarity threshold for same-day duplicates
+        chain_thr: Similarity threshold for multi-day story chains
+
+    Returns:
+        Tuple of (duplicate_pairs, chain_pairs), each of shape [k, 2] with i < j
+    """
+    n = emb.shape[0]
+    dup_counts = np.zeros(n, dtype=np.int64)
+    chain_counts = np.zeros(n, dtype=np.int64)
+    no_pairs = np.empty((0, 2), dtype=np.int64)
+
+    _scan_tiles(
+        emb, days, thr, chain_thr, TILE_SIZE,
+        dup_counts, chain_counts, no_pairs, no_pairs, False
+    )
+
+    dup_cursor = np.zeros(n, dtype=np.int64)
+    chain_cursor = np.zeros(n, dtype=np.int64)
+    dup_cursor[1:] = np.cumsum(dup_counts)[:-1]
+    chain_cursor[1:] = np.cumsum(chain_counts)[:-1]
+
+    dup_pairs = np.empty((dup_counts.sum(), 2), dtype=np.int64)
+    chain_pairs = np.empty((chain_counts.sum(), 2), dtype=np.int64)
+
+    _scan_tiles(
+        emb, days, thr, chain_thr, TILE_SIZE,
+        dup_cursor, chain_cursor, dup_pairs, chain_pairs, True
+    )
+
+    return dup_pairs, chain_pairs
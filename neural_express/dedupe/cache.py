@@ -0,0 +1,117 @@
+"""Persistent on-disk cache for item embeddings."""
+
+import hashlib
+import os
+from pathlib import Path
+import numpy as np
+
+from ..utils.logging import get_logger
+from ..utils.io import ensure_dir
+
+logger = get_logger("dedupe.cache")
+
+# How entry keys are derived; caches written with another scheme are ignored
+KEY_SCHEME = "text-blake2b"
+
+
+class EmbeddingCache:
+    """Embedding cache keyed by a hash of the embedded text, persisted as a single .npz file."""
+
+    def __init__(self, filepath: Path, model_name: str):
+        """
+        Initialize cache and load any existing entries.
+
+        Args:
+            filepath: Path to the .npz cache file
+            model_name: Embedding model name; entries from other models are ignored
+        """
+        self.filepath = filepath
+        self.model_name = model_name
+        self.vectors: dict[str, np.ndarray] = {}
+        self._load()
+
+    @staticmethod
+    def make_key(text: str) -> str:
+        """
+        Build a cache key from the text being embedded.
+
+        Identical text from different items (or a later run) shares one
+        entry, and an item whose text changes gets a new one.
+
+        Args:
+            text: Text passed to the embedding model
+
+        Returns:
+            Hex digest identifying the text
+        """
+        return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+    def _load(self) -> None:
+        """Load cached embeddings from disk."""
+        if not self.filepath.exists():
+            return
+
+        try:
+            with np.load(self.filepath, allow_pickle=False) as data:
+                if str(data["model_name"]) != self.model_name:
+                    logger.info(
+                        f"Ignoring embedding cache built with {data['model_name']}"
+                    )
+                    return
+                if "key_scheme" not in data or str(data["key_scheme"]) != KEY_SCHEME:
+                    logger.info("Ignoring embedding cache with outdated keys")
+                    return
+                self.vectors = dict(zip(data["keys"].tolist(), data["vectors"]))
+        except Exception as e:
+            logger.warning(f"Failed to load embedding cache {self.filepath}: {e}")
+            return
+
+        logger.info(f"Loaded {len(self.vectors)} cached embeddings from {self.filepath}")
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.vectors
+
+    def __len__(self) -> int:
+        return len(self.vectors)
+
+    def get_many(self, keys: list[str]) -> np.ndarray:
+        """
+        Get embeddings for keys, in order.
+
+        Args:
+            keys: Cache keys (all must be present)
+
+        Returns:
+            NumPy array of embeddings (shape: [len(keys), dimension])
+        """
+        return np.stack([self.vectors[key] for key in keys])
+
+    def update(self, keys: list[str], embeddings: np.ndarray) -> None:
+        """
+        Add embeddings to the cache.
+
+        Args:
+            keys: Cache keys
+            embeddings: Embeddings for keys (shape: [len(keys), dimension])
+        """
+        self.vectors.update(zip(keys, np.asarray(embeddings, dtype=np.float32)))
+
+    def save(self) -> None:
+        """Atomically write the cache to disk."""
+        if not self.vectors:
+            return
+
+        ensure_dir(self.filepath.parent)
+        tmp_path = self.filepath.with_suffix(f".tmp{os.getpid()}")
+
+        with open(tmp_path, "wb") as f:
+            np.savez(
+                f,
+                model_name=np.array(self.model_name),
+                key_scheme=np.array(KEY_SCHEME),
+                keys=np.array(list(self.vectors)),
+                vectors=np.stack(list(self.vectors.values()))
+            )
+        os.replace(tmp_path, self.filepath)
+
+        logger.debug(f"Saved {len(self.vectors)} embeddings to {self.filepath}")
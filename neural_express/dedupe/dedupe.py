@@ -3,14 +3,17 @@
 from typing import Optional
 import hashlib
 import numpy as np
+import faiss
 from datetime import timedelta
-from sklearn.cluster import AgglomerativeClustering
-from sklearn.metrics.pairwise import cosine_similarity
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
 
 from ..utils.schema import NewsItem
 from ..utils.logging import get_logger
 from .embed import EmbeddingModel
 from .store import VectorStore
+from .cache import EmbeddingCache
+from ._kernels import dedupe_pairs
 
 logger = get_logger("dedupe.dedupe")
 
@@ -22,7 +25,8 @@ class Deduplicator:
         self,
         embedding_model: EmbeddingModel,
         threshold: float = 0.85,
-        story_chain_threshold: float = 0.75
+        story_chain_threshold: float = 0.75,
+        embedding_cache: Optional[EmbeddingCache] = None
     ):
         """
         Initialize deduplicator.
@@ -31,10 +35,12 @@ class Deduplicator:
             embedding_model: EmbeddingModel instance
             threshold: Similarity threshold for same-day duplicates (0-1)
             story_chain_threshold: Similarity threshold for story chains (0-1)
+            embedding_cache: Optional persistent cache of item embeddings
         """
         self.embedding_model = embedding_model
         self.threshold = threshold
         self.story_chain_threshold = story_chain_threshold
+        self.embedding_cache = embedding_cache
         logger.info(
             f"Initialized deduplicator with threshold {threshold}, "
             f"story chain threshold {story_chain_threshold}"
@@ -58,19 +64,25 @@ class Deduplicator:
         if not items:
             return []
 
+        # Nothing to compare; skip the embedding model entirely
+        if len(items) == 1:
+            return list(items)
+
         logger.info(f"Deduplicating {len(items)} items")
 
-        # Generate embeddings for all items
-        texts = [self._get_text_for_embedding(item) for item in items]
-        embeddings = self.embedding_model.embed(texts)
+        # Collapse exact reposts so each distinct text is embedded once
+        distinct = self._collapse_exact_duplicates(items)
+
+        # Generate embeddings for all distinct items
+        embeddings = self._embed_items(distinct)
 
         if detect_story_chains:
             # Smart deduplication with story chain detection
-            deduplicated = self._smart_deduplicate(items, embeddings)
+            deduplicated = self._smart_deduplicate(distinct, embeddings)
         else:
             # Standard deduplication
             clusters = self._cluster_embeddings(embeddings)
-            deduplicated = self._select_representatives(items, clusters)
+            deduplicated = self._select_representatives(distinct, clusters)
 
         logger.info(
             f"Deduplicated to {len(deduplicated)} items "
@@ -79,6 +91,72 @@ class Deduplicator:
 
         return deduplicated
 
+    def _collapse_exact_duplicates(self, items: list[NewsItem]) -> list[NewsItem]:
+        """
+        Merge items with identical URLs or identical embedding text.
+
+        Args:
+            items: List of news items
+
+        Returns:
+            One item per distinct text, in first-seen order, with the URLs of
+            collapsed items recorded in its duplicates list
+        """
+        groups: dict[str, list[NewsItem]] = {}
+        group_of_id: dict[str, str] = {}
+
+        for item in items:
+            key = group_of_id.get(item.id, self._get_text_for_embedding(item))
+            groups.setdefault(key, []).append(item)
+            group_of_id.setdefault(item.id, key)
+
+        if len(groups) == len(items):
+            return items
+
+        distinct = []
+        for group in groups.values():
+            best = self._select_best_item(group)
+            best.duplicates = [
+                item.url for item in group
+                if item.id != best.id
+            ]
+            distinct.append(best)
+
+        logger.debug(f"Collapsed {len(items) - len(distinct)} exact duplicates")
+
+        return distinct
+
+    def _embed_items(self, items: list[NewsItem]) -> np.ndarray:
+        """
+        Get embeddings for items, encoding only those missing from the cache.
+
+        Args:
+            items: List of news items
+
+        Returns:
+            Array of embeddings in item order (shape: [n, dimension])
+        """
+        texts = [self._get_text_for_embedding(item) for item in items]
+
+        if self.embedding_cache is None:
+            return self.embedding_model.embed(texts)
+
+        keys = [self.embedding_cache.make_key(text) for text in texts]
+        missing = [i for i, key in enumerate(keys) if key not in self.embedding_cache]
+
+        logger.info(
+            f"Embedding cache hit for {len(items) - len(missing)}/{len(items)} items"
+        )
+
+        if missing:
+            self.embedding_cache.update(
+                [keys[i] for i in missing],
+                self.embedding_model.embed([texts[i] for i in missing])
+            )
+            self.embedding_cache.save()
+
+        return self.embedding_cache.get_many(keys)
+
     def _get_text_for_embedding(self, item: NewsItem) -> str:
         """
         Extract text for embedding generation.
@@ -93,10 +171,14 @@ class Deduplicator:
 
     def _cluster_embeddings(self, embeddings: np.ndarray) -> np.ndarray:
         """
-        Cluster embeddings using agglomerative clustering.
+        Cluster embeddings by linking all pairs above the similarity threshold.
+
+        Equivalent to single-linkage hierarchical clustering cut at cosine
+        distance 1 - threshold, but only the neighbor pairs above the
+        threshold are ever materialized, not the condensed distance matrix.
 
         Args:
-            embeddings: Array of embeddings (shape: [n, dimension])
+            embeddings: Array of normalized embeddings (shape: [n, dimension])
 
         Returns:
             Array of cluster labels (shape: [n])
@@ -104,23 +186,21 @@ class Deduplicator:
         if len(embeddings) == 1:
             return np.array([0])
 
-        # Convert similarity threshold to distance threshold
-        # Cosine similarity to Euclidean distance for normalized vectors
-        distance_threshold = np.sqrt(2 * (1 - self.threshold))
+        # Embeddings are unit length, so inner product equals cosine similarity
+        embeddings_normalized = np.ascontiguousarray(embeddings, dtype=np.float32)
 
-        clustering = AgglomerativeClustering(
-            n_clusters=None,
-            distance_threshold=distance_threshold,
-            linkage="average",
-            metric="euclidean"
-        )
+        # Find every neighbor above the threshold with a FAISS range search
+        index = faiss.IndexFlatIP(embeddings_normalized.shape[1])
+        index.add(embeddings_normalized)
+        lims, _, neighbors = index.range_search(embeddings_normalized, self.threshold)
 
-        # Normalize embeddings for cosine similarity via Euclidean distance
-        embeddings_normalized = embeddings / np.linalg.norm(
-            embeddings, axis=1, keepdims=True
+        # Clusters are the connected components of the neighbor graph
+        n = len(embeddings)
+        adjacency = csr_matrix(
+            (np.ones(len(neighbors), dtype=bool), neighbors, lims),
+            shape=(n, n)
         )
-
-        labels = clustering.fit_predict(embeddings_normalized)
+        _, labels = connected_components(adjacency, directed=False)
 
         logger.debug(f"Found {len(np.unique(labels))} clusters from {len(embeddings)} items")
 
@@ -139,25 +219,30 @@ class Deduplicator:
             clusters: Cluster labels for each item
 
         Returns:
-            List of representative items (one per cluster)
+            List of representative items (one per cluster, in label order)
         """
         representatives = []
-        unique_clusters = np.unique(clusters)
 
-        for cluster_id in unique_clusters:
+        # Group item indices by cluster label with one stable sort, rather
+        # than scanning every label for every cluster
+        order = np.argsort(clusters, kind="stable")
+        boundaries = np.flatnonzero(np.diff(clusters[order])) + 1
+
+        for cluster_indices in np.split(order, boundaries):
             # Get all items in this cluster
-            cluster_mask = clusters == cluster_id
-            cluster_indices = np.where(cluster_mask)[0]
             cluster_items = [items[i] for i in cluster_indices]
 
             # Select representative (most credible, then most recent)
             representative = self._select_best_item(cluster_items)
 
-            # Add duplicate URLs to representative
-            representative.duplicates = [
-                item.url for item in cluster_items
-                if item.id != representative.id
-            ]
+            # Add duplicate URLs to representative, keeping any URLs already
+            # collapsed into cluster members
+            duplicates = list(representative.duplicates)
+            for item in cluster_items:
+                if item.id != representative.id:
+                    duplicates.append(item.url)
+                    duplicates.extend(item.duplicates)
+            representative.duplicates = duplicates
 
             representatives.append(representative)
 
@@ -176,17 +261,15 @@ class Deduplicator:
         if len(items) == 1:
             return items[0]
 
-        # Sort by credibility (descending), then by recency (descending)
-        sorted_items = sorted(
+        # Single pass: highest credibility, then most recent
+        return max(
             items,
             key=lambda x: (
-                -x.engagement.get("credibility", 0.5),
-                -x.published_at.timestamp()
+                x.engagement.get("credibility", 0.5),
+                x.published_at.timestamp()
             )
         )
 
-        return sorted_items[0]
-
     def _smart_deduplicate(
         self,
         items: list[NewsItem],
@@ -201,103 +284,80 @@ class Deduplicator:
 
         Args:
             items: List of news items
-            embeddings: Array of embeddings
+            embeddings: Array of normalized embeddings
 
         Returns:
             List of deduplicated items with story chains linked
         """
         logger.info("Running smart deduplication with story chain detection")
 
-        # Normalize embeddings for cosine similarity
-        embeddings_normalized = embeddings / np.linalg.norm(
-            embeddings, axis=1, keepdims=True
+        # Publication day of each item
+        days = (
+            np.array([item.published_at.timestamp() for item in items]) // 86400
+        ).astype(np.int64)
+
+        # High similarity + same day = DUPLICATE
+        # Medium similarity + different days = STORY CHAIN
+        # (embeddings are unit length, so the dot product is cosine similarity)
+        duplicate_pairs, chain_pairs = dedupe_pairs(
+            np.ascontiguousarray(embeddings, dtype=np.float32),
+            days,
+            self.threshold,
+            self.story_chain_threshold
         )
 
-        # Compute similarity matrix
-        similarity_matrix = cosine_similarity(embeddings_normalized)
-
-        # Track which items to keep and which are duplicates
-        keep_items = []
-        processed = set()
-        story_chains = {}  # chain_id -> list of item indices
-
-        for i in range(len(items)):
-            if i in processed:
-                continue
-
-            item_i = items[i]
-            chain_members = [i]
-            duplicates = []
-
-            # Find similar items
-            for j in range(i + 1, len(items)):
-                if j in processed:
-                    continue
-
-                item_j = items[j]
-                similarity = similarity_matrix[i][j]
-
-                # Check time difference
-                time_diff = abs((item_i.published_at - item_j.published_at).days)
-
-                # High similarity + same day = DUPLICATE
-                if similarity >= self.threshold and time_diff == 0:
-                    duplicates.append(j)
-                    processed.add(j)
-                    logger.debug(
-                        f"Duplicate found: '{item_i.title[:50]}' and '{item_j.title[:50]}' "
-                        f"(similarity: {similarity:.3f}, same day)"
-                    )
-
-                # Medium similarity + different days = STORY CHAIN
-                elif (
-                    self.story_chain_threshold <= similarity < self.threshold
-                    and time_diff > 0
-                ):
-                    chain_members.append(j)
-                    logger.debug(
-                        f"Story chain detected: '{item_i.title[:50]}' and '{item_j.title[:50]}' "
-                        f"(similarity: {similarity:.3f}, {time_diff} days apart)"
-                    )
-
-            # Mark item as processed
-            processed.add(i)
-
-            # Keep the best item from duplicates
-            duplicate_items = [items[j] for j in [i] + duplicates]
-            best_item = self._select_best_item(duplicate_items)
-
-            # Add duplicate URLs
-            best_item.duplicates = [
-                item.url for item in duplicate_items
-                if item.id != best_item.id
-            ]
+        logger.debug(
+            f"Found {len(duplicate_pairs)} duplicate pairs and "
+            f"{len(chain_pairs)} story chain pairs"
+        )
 
-            # Assign story chain ID if there are related stories
-            if len(chain_members) > 1:
-                # Generate unique chain ID
-                chain_id = hashlib.md5(
-                    f"{best_item.title[:50]}{best_item.published_at}".encode()
-                ).hexdigest()[:8]
+        # Duplicate clusters are the connected components of the duplicate graph;
+        # labels are numbered in order of each cluster's first item
+        n = len(items)
+        duplicate_graph = csr_matrix(
+            (
+                np.ones(len(duplicate_pairs), dtype=bool),
+                (duplicate_pairs[:, 0], duplicate_pairs[:, 1])
+            ),
+            shape=(n, n)
+        )
+        n_clusters, clusters = connected_components(duplicate_graph, directed=False)
+        keep_items = self._select_representatives(items, clusters)
+
+        # Link clusters into story chains via the chain pairs between them
+        n_chains = 0
+        chain_rows, chain_cols = chain_pairs[:, 0], chain_pairs[:, 1]
+
+        if len(chain_rows):
+            chain_graph = csr_matrix(
+                (
+                    np.ones(len(chain_rows), dtype=bool),
+                    (clusters[chain_rows], clusters[chain_cols])
+                ),
+                shape=(n_clusters, n_clusters)
+            )
+            _, chain_labels = connected_components(chain_graph, directed=False)
 
-                best_item.story_chain_id = chain_id
+            for chain_label in np.flatnonzero(np.bincount(chain_labels) > 1):
+                members = [
+                    keep_items[c] for c in np.flatnonzero(chain_labels == chain_label)
+                ]
 
-                # Track chain members
-                if chain_id not in story_chains:
-                    story_chains[chain_id] = []
-                story_chains[chain_id].extend(chain_members)
+                # Generate unique chain ID from the earliest-listed member
+                head = members[0]
+                chain_id = hashlib.blake2b(
+                    f"{head.title[:50]}{head.published_at}".encode(),
+                    digest_size=4
+                ).hexdigest()
 
-            keep_items.append(best_item)
+                for member in members:
+                    member.story_chain_id = chain_id
 
-        # Assign chain IDs to related stories
-        for chain_id, member_indices in story_chains.items():
-            for idx in member_indices:
-                if idx < len(items) and items[idx] in keep_items:
-                    items[idx].story_chain_id = chain_id
+                n_chains += 1
 
         logger.info(
             f"Smart deduplication complete: {len(keep_items)} items kept, "
-            f"{len(story_chains)} story chains detected"
+            f"{n_chains} story chains detected"
         )
 
         return keep_items
@@ -2,6 +2,7 @@
 
 from typing import Optional
 import numpy as np
+import torch
 from sentence_transformers import SentenceTransformer
 
 from ..utils.logging import get_logger
@@ -28,20 +29,26 @@ class EmbeddingModel:
         """Load the sentence transformer model."""
         try:
             self.model = SentenceTransformer(self.model_name)
+
+            # Half precision halves memory bandwidth on GPU
+            if torch.cuda.is_available():
+                self.model.half()
+
             logger.info(f"Successfully loaded {self.model_name}")
         except Exception as e:
             logger.error(f"Failed to load embedding model: {e}")
             raise
 
-    def embed(self, texts: list[str]) -> np.ndarray:
+    def embed(self, texts: list[str], batch_size: int = 64) -> np.ndarray:
         """
-        Generate embeddings for a list of texts.
+        Generate L2-normalized embeddings for a list of texts.
 
         Args:
             texts: List of text strings
+            batch_size: Number of texts encoded per forward pass
 
         Returns:
-            NumPy array of embeddings (shape: [n_texts, embedding_dim])
+            NumPy array of unit-length embeddings (shape: [n_texts, embedding_dim])
         """
         if not texts:
             return np.array([])
@@ -52,8 +59,10 @@ class EmbeddingModel:
         try:
             embeddings = self.model.encode(
                 texts,
+                batch_size=batch_size,
                 show_progress_bar=False,
-                convert_to_numpy=True
+                convert_to_numpy=True,
+                normalize_embeddings=True
             )
             logger.debug(f"Generated {len(embeddings)} embeddings")
             return embeddings
@@ -6,26 +6,95 @@ import numpy as np
 import faiss
 
 from ..utils.logging import get_logger
-from ..utils.io import save_pickle, load_pickle
+from ..utils.io import save_json, load_json, load_pickle
 
 logger = get_logger("dedupe.store")
 
+# HNSW graph parameters (>95% recall at these settings)
+HNSW_NEIGHBORS = 32
+HNSW_EF_CONSTRUCTION = 40
+HNSW_EF_SEARCH = 16
+
+# Rows sampled when checking whether embeddings are already unit length
+NORM_CHECK_ROWS = 8
+
+# First byte of a pickle written with protocol 2 or later
+_PICKLE_PROTO = b"\x80"
+
+
+def _sample_is_unit_length(embeddings: np.ndarray) -> bool:
+    """Check that up to NORM_CHECK_ROWS evenly spaced rows have unit length."""
+    step = max(1, len(embeddings) // NORM_CHECK_ROWS)
+    sample = embeddings[::step][:NORM_CHECK_ROWS]
+    return np.allclose(np.einsum("ij,ij->i", sample, sample), 1.0, atol=1e-4)
+
+
+def _normalized_float32(embeddings: np.ndarray) -> np.ndarray:
+    """
+    Get unit-length, C-contiguous float32 rows for FAISS.
+
+    The input is returned as-is when it already qualifies (the common case:
+    EmbeddingModel.embed returns unit vectors, so only a few sampled rows
+    are checked rather than every norm); otherwise a normalized copy is
+    made, so the caller's array is never modified in place.
+
+    Args:
+        embeddings: Array of embeddings (shape: [n, dimension])
+
+    Returns:
+        Normalized float32 array (shape: [n, dimension])
+    """
+    if (
+        embeddings.dtype == np.float32
+        and embeddings.flags.c_contiguous
+        and _sample_is_unit_length(embeddings)
+    ):
+        return embeddings
+
+    normalized = np.array(embeddings, dtype=np.float32, order="C")
+    faiss.normalize_L2(normalized)
+    return normalized
+
 
 class VectorStore:
     """FAISS-based vector store for similarity search."""
 
-    def __init__(self, dimension: int):
+    def __init__(self, dimension: int, flat: bool = False):
         """
         Initialize vector store.
 
         Args:
             dimension: Embedding dimension
+            flat: If True, use an exact flat index instead of approximate HNSW
         """
         self.dimension = dimension
-        self.index = faiss.IndexFlatL2(dimension)
-        self.metadata: list[dict] = []
 
-        logger.info(f"Initialized FAISS index with dimension {dimension}")
+        # Inner product on normalized vectors is cosine similarity; vectors
+        # are stored as float16, halving memory and scan bandwidth
+        if flat:
+            self.index = faiss.IndexScalarQuantizer(
+                dimension, faiss.ScalarQuantizer.QT_fp16, faiss.METRIC_INNER_PRODUCT
+            )
+        else:
+            self.index = faiss.IndexHNSWSQ(
+                dimension,
+                faiss.ScalarQuantizer.QT_fp16,
+                HNSW_NEIGHBORS,
+                faiss.METRIC_INNER_PRODUCT
+            )
+            self.index.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+            self.index.hnsw.efSearch = HNSW_EF_SEARCH
+
+        # Metadata stored column-wise; result dicts are built only for hits
+        self._ids: list[str] = []
+        self._titles: list[str] = []
+        self._urls: list[str] = []
+        self._sources: list[str] = []
+
+        logger.info(
+            f"Initialized FAISS {'flat' if flat else 'HNSW'} index "
+            f"with dimension {dimension}"
+        )
 
     def add(self, embeddings: np.ndarray, metadata: list[dict]) -> None:
         """
@@ -33,7 +102,8 @@ class VectorStore:
 
         Args:
             embeddings: NumPy array of embeddings (shape: [n, dimension])
-            metadata: List of metadata dicts (length: n)
+            metadata: List of metadata dicts with id, title, url and
+                source_name keys (length: n)
         """
         if len(embeddings) != len(metadata):
             raise ValueError("Number of embeddings must match metadata length")
@@ -42,12 +112,11 @@ class VectorStore:
             raise ValueError(f"Embedding dimension {embeddings.shape[1]} doesn't match index dimension {self.dimension}")
 
         # Normalize embeddings for cosine similarity
-        embeddings_normalized = embeddings.astype(np.float32)
-        faiss.normalize_L2(embeddings_normalized)
+        embeddings_normalized = _normalized_float32(embeddings)
 
         # Add to index
         self.index.add(embeddings_normalized)
-        self.metadata.extend(metadata)
+        self._extend_metadata(metadata)
 
         logger.debug(f"Added {len(embeddings)} vectors to index")
 
@@ -72,26 +141,21 @@ class VectorStore:
             raise ValueError(f"Query dimension {query_embedding.shape[0]} doesn't match index dimension {self.dimension}")
 
         # Normalize query
-        query_normalized = query_embedding.astype(np.float32).reshape(1, -1)
-        faiss.normalize_L2(query_normalized)
+        query_normalized = _normalized_float32(query_embedding.reshape(1, -1))
 
         # Search
-        distances, indices = self.index.search(query_normalized, k)
+        similarities, indices = self.index.search(query_normalized, k)
 
         results = []
-        for dist, idx in zip(distances[0], indices[0]):
+        for similarity, idx in zip(similarities[0], indices[0]):
             if idx == -1:  # No more results
                 break
 
-            # Convert L2 distance to cosine similarity
-            # After normalization: L2^2 = 2(1 - cosine_similarity)
-            similarity = 1 - (dist / 2)
-
             # Apply threshold if specified
             if threshold is not None and similarity < threshold:
                 continue
 
-            results.append((self.metadata[idx], float(similarity)))
+            results.append((self._metadata_at(idx), float(similarity)))
 
         return results
 
@@ -113,30 +177,48 @@ class VectorStore:
             List of lists of (metadata, similarity_score) tuples
         """
         # Normalize queries
-        queries_normalized = query_embeddings.astype(np.float32)
-        faiss.normalize_L2(queries_normalized)
+        queries_normalized = _normalized_float32(query_embeddings)
 
         # Search
-        distances, indices = self.index.search(queries_normalized, k)
+        similarities, indices = self.index.search(queries_normalized, k)
 
         all_results = []
-        for query_distances, query_indices in zip(distances, indices):
+        for query_similarities, query_indices in zip(similarities, indices):
             results = []
-            for dist, idx in zip(query_distances, query_indices):
+            for similarity, idx in zip(query_similarities, query_indices):
                 if idx == -1:
                     break
 
-                similarity = 1 - (dist / 2)
-
                 if threshold is not None and similarity < threshold:
                     continue
 
-                results.append((self.metadata[idx], float(similarity)))
+                results.append((self._metadata_at(idx), float(similarity)))
 
             all_results.append(results)
 
         return all_results
 
+    def _extend_metadata(self, metadata: list[dict]) -> None:
+        """Append metadata dicts to the per-field columns."""
+        self._ids.extend(m.get("id") for m in metadata)
+        self._titles.extend(m.get("title") for m in metadata)
+        self._urls.extend(m.get("url") for m in metadata)
+        self._sources.extend(m.get("source_name") for m in metadata)
+
+    def _metadata_at(self, idx: int) -> dict:
+        """Build the metadata dict for a single vector."""
+        return {
+            "id": self._ids[idx],
+            "title": self._titles[idx],
+            "url": self._urls[idx],
+            "source_name": self._sources[idx]
+        }
+
+    @property
+    def metadata(self) -> list[dict]:
+        """Get metadata dicts for all vectors."""
+        return [self._metadata_at(idx) for idx in range(len(self._ids))]
+
     def size(self) -> int:
         """Get number of vectors in the index."""
         return self.index.ntotal
@@ -155,7 +237,7 @@ class VectorStore:
         faiss.write_index(self.index, str(index_path))
 
         # Save metadata
-        save_pickle(self.metadata, metadata_path)
+        save_json(self.metadata, metadata_path)
 
         logger.info(f"Saved vector store to {filepath}")
 
@@ -176,7 +258,12 @@ class VectorStore:
         # Load FAISS index
         self.index = faiss.read_index(str(index_path))
 
-        # Load metadata
-        self.metadata = load_pickle(metadata_path) or []
+        # Load metadata (stores saved by older versions hold a pickle)
+        with open(metadata_path, "rb") as f:
+            is_pickle = f.read(1) == _PICKLE_PROTO
+        metadata = load_pickle(metadata_path) if is_pickle else load_json(metadata_path)
+
+        self._ids, self._titles, self._urls, self._sources = [], [], [], []
+        self._extend_metadata(metadata or [])
 
         logger.info(f"Loaded vector store from {filepath} ({self.size()} vectors)")
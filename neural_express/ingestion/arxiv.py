@@ -1,23 +1,27 @@
 """arXiv API ingestion module (optional)."""
 
 import hashlib
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 import httpx
 import xml.etree.ElementTree as ET
 
 from ..utils.schema import NewsItem
 from ..utils.logging import get_logger
+from ..utils.http import client_or_default, STREAM_CHUNK_SIZE
 
 logger = get_logger("ingestion.arxiv")
 
 ARXIV_API_URL = "http://export.arxiv.org/api/query"
+ATOM_NAMESPACE = {"atom": "http://www.w3.org/2005/Atom"}
+ATOM_ENTRY_TAG = "{http://www.w3.org/2005/Atom}entry"
 
 
 async def fetch_arxiv_papers(
     query: str = "cat:cs.AI OR cat:cs.LG OR cat:cs.CL",
     max_results: int = 50,
-    timeout: int = 30
+    timeout: int = 30,
+    client: Optional[httpx.AsyncClient] = None
 ) -> list[NewsItem]:
     """
     Fetch recent papers from arXiv.
@@ -26,6 +30,7 @@ async def fetch_arxiv_papers(
         query: arXiv API query string
         max_results: Maximum number of results
         timeout: Request timeout in seconds
+        client: Optional shared HTTP client (a new one is used if omitted)
 
     Returns:
         List of normalized NewsItem objects
@@ -41,24 +46,21 @@ async def fetch_arxiv_papers(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.get(ARXIV_API_URL, params=params)
-            response.raise_for_status()
-            content = response.text
+        items = []
+        parser = ET.XMLPullParser(events=("end",))
 
-        # Parse XML
-        root = ET.fromstring(content)
-        namespace = {"atom": "http://www.w3.org/2005/Atom"}
+        # Stream the response into the parser, handling entries as they close
+        async with client_or_default(client, timeout) as http:
+            async with http.stream(
+                "GET", ARXIV_API_URL, params=params, timeout=timeout
+            ) as response:
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+                    parser.feed(chunk)
+                    _drain_entries(parser, items)
 
-        items = []
-        for entry in root.findall("atom:entry", namespace):
-            try:
-                news_item = _parse_arxiv_entry(entry, namespace)
-                if news_item:
-                    items.append(news_item)
-            except Exception as e:
-                logger.warning(f"Error parsing arXiv entry: {e}")
-                continue
+        parser.close()
+        _drain_entries(parser, items)
 
         logger.info(f"Fetched {len(items)} papers from arXiv")
         return items
@@ -74,6 +76,29 @@ async def fetch_arxiv_papers(
         return []
 
 
+def _drain_entries(parser: ET.XMLPullParser, items: list[NewsItem]) -> None:
+    """
+    Parse completed entries from the pull parser and free them.
+
+    Args:
+        parser: XML pull parser fed with response chunks
+        items: List to append parsed NewsItem objects to
+    """
+    for _, elem in parser.read_events():
+        if elem.tag != ATOM_ENTRY_TAG:
+            continue
+
+        try:
+            news_item = _parse_arxiv_entry(elem, ATOM_NAMESPACE)
+            if news_item:
+                items.append(news_item)
+        except Exception as e:
+            logger.warning(f"Error parsing arXiv entry: {e}")
+        finally:
+            # Release the entry subtree once parsed
+            elem.clear()
+
+
 def _parse_arxiv_entry(
     entry: ET.Element,
     namespace: dict
@@ -102,15 +127,16 @@ def _parse_arxiv_entry(
     url = id_elem.text.strip()
 
     # Generate stable ID
-    item_id = hashlib.md5(url.encode()).hexdigest()
+    item_id = hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
 
     # Parse date
     published_at = datetime.now()
     if published_elem is not None:
         try:
+            # Naive UTC, matching the RSS items they're ranked and chained with
             published_at = datetime.fromisoformat(
                 published_elem.text.replace("Z", "+00:00")
-            )
+            ).astimezone(timezone.utc).replace(tzinfo=None)
         except Exception:
             pass
 
@@ -0,0 +1,125 @@
+"""Conditional GET cache for RSS feeds."""
+
+import os
+import pickle
+from pathlib import Path
+from typing import Optional
+
+from ..utils.schema import NewsItem
+from ..utils.logging import get_logger
+from ..utils.io import ensure_dir
+
+logger = get_logger("ingestion.feed_cache")
+
+
+class FeedCache:
+    """Per-feed ETag / Last-Modified validators and last parsed items."""
+
+    def __init__(self, filepath: Path):
+        """
+        Initialize cache and load any existing entries.
+
+        Args:
+            filepath: Path to the pickle cache file
+        """
+        self.filepath = filepath
+        self.entries: dict[str, dict] = {}
+        self._load()
+
+    def _load(self) -> None:
+        """Load cached feed entries from disk."""
+        if not self.filepath.exists():
+            return
+
+        try:
+            with open(self.filepath, "rb") as f:
+                self.entries = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Failed to load feed cache {self.filepath}: {e}")
+            return
+
+        logger.info(f"Loaded {len(self.entries)} cached feeds from {self.filepath}")
+
+    def conditional_headers(self, url: str) -> dict[str, str]:
+        """
+        Get conditional request headers for a feed.
+
+        Args:
+            url: Feed URL
+
+        Returns:
+            Dict with If-None-Match / If-Modified-Since (empty if not cached)
+        """
+        entry = self.entries.get(url)
+        if entry is None:
+            return {}
+
+        headers = {}
+        if entry["etag"]:
+            headers["If-None-Match"] = entry["etag"]
+        if entry["last_modified"]:
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+        return headers
+
+    def get_items(self, url: str) -> Optional[list[NewsItem]]:
+        """
+        Get items parsed from the last full response for a feed.
+
+        Args:
+            url: Feed URL
+
+        Returns:
+            List of NewsItem objects, or None if not cached
+        """
+        entry = self.entries.get(url)
+        return None if entry is None else entry["items"]
+
+    def update(
+        self,
+        url: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        items: list[NewsItem]
+    ) -> None:
+        """
+        Record validators and parsed items for a feed.
+
+        Feeds without either validator can't be revalidated, so they are
+        dropped from the cache instead.
+
+        Args:
+            url: Feed URL
+            etag: ETag response header
+            last_modified: Last-Modified response header
+            items: Items parsed from the response
+        """
+        if not etag and not last_modified:
+            self.entries.pop(url, None)
+            return
+
+        self.entries[url] = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "items": items
+        }
+
+    def discard(self, url: str) -> None:
+        """
+        Forget a feed, so its next fetch is unconditional.
+
+        Args:
+            url: Feed URL
+        """
+        self.entries.pop(url, None)
+
+    def save(self) -> None:
+        """Atomically write the cache to disk."""
+        ensure_dir(self.filepath.parent)
+        tmp_path = self.filepath.with_suffix(f".tmp{os.getpid()}")
+
+        with open(tmp_path, "wb") as f:
+            pickle.dump(self.entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.filepath)
+
+        logger.debug(f"Saved {len(self.entries)} feeds to {self.filepath}")
@@ -1,6 +1,7 @@
 """Mock data generator for testing."""
 
 import hashlib
+from dataclasses import replace
 from datetime import datetime, timedelta
 from ..utils.schema import NewsItem
 
@@ -94,7 +95,7 @@ def generate_mock_data(count: int = 20) -> list[NewsItem]:
     for i in range(min(count, len(mock_stories))):
         story = mock_stories[i]
         url = f"https://example.com/article-{i}"
-        item_id = hashlib.md5(url.encode()).hexdigest()
+        item_id = hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
 
         # Stagger publication times
         published_at = base_time - timedelta(hours=i * 2)
@@ -123,20 +124,17 @@ def generate_mock_data(count: int = 20) -> list[NewsItem]:
 
             # Create slight variation
             url = f"https://different-site.com/article-{i}"
-            item_id = hashlib.md5(url.encode()).hexdigest()
+            item_id = hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
 
-            duplicate = NewsItem(
+            duplicate = replace(
+                original,
                 id=item_id,
-                source="rss",
                 source_name="Different Source",
                 title=original.title + " - Updated",  # Slight title variation
                 url=url,
                 published_at=original.published_at + timedelta(hours=1),
-                author=original.author,
-                summary_raw=original.summary_raw,
-                content_snippet=original.content_snippet,
-                tags=original.tags,
-                engagement={"credibility": 0.75}
+                engagement={"credibility": 0.75},
+                duplicates=[]
             )
 
             items.append(duplicate)
@@ -1,22 +1,31 @@
 """Normalization utilities for ingested data."""
 
+from datetime import datetime
+from typing import Optional
+
 from ..utils.schema import NewsItem
 from ..utils.logging import get_logger
 
 logger = get_logger("ingestion.normalize")
 
 
-def normalize_items(items: list[NewsItem]) -> list[NewsItem]:
+def normalize_items(
+    items: list[NewsItem],
+    cutoff: Optional[datetime] = None
+) -> list[NewsItem]:
     """
     Normalize and clean news items.
 
     Args:
         items: List of news items
+        cutoff: If given, drop items published before this time in the same pass
 
     Returns:
         List of normalized news items
     """
     normalized = []
+    cutoff_ts = cutoff.timestamp() if cutoff is not None else None
+    too_old = 0
 
     for item in items:
         # Basic validation
@@ -24,6 +33,11 @@ def normalize_items(items: list[NewsItem]) -> list[NewsItem]:
             logger.warning(f"Skipping item with missing title or URL: {item.id}")
             continue
 
+        # Time window, checked before any cleaning work
+        if cutoff_ts is not None and item.published_at.timestamp() < cutoff_ts:
+            too_old += 1
+            continue
+
         # Clean title
         item.title = _clean_text(item.title)
 
@@ -37,6 +51,8 @@ def normalize_items(items: list[NewsItem]) -> list[NewsItem]:
         normalized.append(item)
 
     logger.info(f"Normalized {len(normalized)} items from {len(items)} raw items")
+    if cutoff is not None:
+        logger.info(f"Dropped {too_old} items published before {cutoff:%Y-%m-%d %H:%M}")
     return normalized
 
 
@@ -45,12 +61,5 @@ def _clean_text(text: str) -> str:
     if not text:
         return ""
 
-    # Remove excessive whitespace
-    text = " ".join(text.split())
-
-    # Remove common artifacts
-    text = text.replace("\n", " ")
-    text = text.replace("\t", " ")
-    text = text.replace("\r", " ")
-
-    return text.strip()
+    # Collapse all whitespace runs (including newlines and tabs) to one space
+    return " ".join(text.split())
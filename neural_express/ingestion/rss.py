@@ -1,7 +1,12 @@
 """RSS feed ingestion module."""
 
+import asyncio
 import hashlib
-from datetime import datetime
+import re
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from typing import Optional
 import feedparser
 import httpx
@@ -9,13 +14,23 @@ from dateutil import parser as date_parser
 
 from ..utils.schema import NewsItem
 from ..utils.logging import get_logger
+from ..utils.http import client_or_default, STREAM_CHUNK_SIZE
+from .feed_cache import FeedCache
 
 logger = get_logger("ingestion.rss")
 
+# Entry date elements (RSS, Atom, Dublin Core), in order of preference
+_DATE_TAGS = ("pubDate", "published", "date", "updated", "modified")
+
+# Runs of HTML tags and whitespace, each collapsed to a single space
+_HTML_TAG_OR_SPACE_RE = re.compile(r"(?:<[^>]+>|\s)+")
+
 
 async def fetch_rss_feed(
     feed_config: dict,
-    timeout: int = 30
+    timeout: int = 30,
+    client: Optional[httpx.AsyncClient] = None,
+    feed_cache: Optional[FeedCache] = None
 ) -> list[NewsItem]:
     """
     Fetch and parse RSS feed.
@@ -23,6 +38,9 @@ async def fetch_rss_feed(
     Args:
         feed_config: Feed configuration dict with name, url, credibility
         timeout: Request timeout in seconds
+        client: Optional shared HTTP client (a new one is used if omitted)
+        feed_cache: Optional cache for conditional GETs; unchanged feeds
+            (304 Not Modified) return the previously parsed items
 
     Returns:
         List of normalized NewsItem objects
@@ -34,27 +52,60 @@ async def fetch_rss_feed(
     logger.info(f"Fetching RSS feed: {feed_name}")
 
     try:
-        # Fetch feed content
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.get(feed_url)
-            response.raise_for_status()
-            content = response.text
-
-        # Parse feed
-        feed = feedparser.parse(content)
-
-        if feed.bozo:
-            logger.warning(f"Feed parsing error for {feed_name}: {feed.bozo_exception}")
-
         items = []
-        for entry in feed.entries:
+        chunks = []
+        parser: Optional[ET.XMLPullParser] = ET.XMLPullParser(events=("end",))
+
+        headers = feed_cache.conditional_headers(feed_url) if feed_cache else {}
+
+        # Stream the response into the parser, handling entries as they close
+        async with client_or_default(client, timeout) as http:
+            async with http.stream(
+                "GET", feed_url, headers=headers, timeout=timeout
+            ) as response:
+                if response.status_code == 304 and feed_cache is not None:
+                    items = feed_cache.get_items(feed_url)
+                    logger.info(f"Not modified: {feed_name} ({len(items)} cached items)")
+                    return items
+
+                response.raise_for_status()
+                validators = (
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified")
+                )
+                async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+                    chunks.append(chunk)
+                    if parser is None:
+                        continue
+                    try:
+                        parser.feed(chunk)
+                        _drain_entries(parser, items, feed_name, credibility)
+                    except ET.ParseError as e:
+                        logger.warning(f"Feed parsing error for {feed_name}: {e}")
+                        parser = None
+
+        if parser is not None:
             try:
-                news_item = _parse_feed_entry(entry, feed_name, credibility)
-                if news_item:
-                    items.append(news_item)
-            except Exception as e:
-                logger.warning(f"Error parsing entry from {feed_name}: {e}")
-                continue
+                parser.close()
+                _drain_entries(parser, items, feed_name, credibility)
+            except ET.ParseError as e:
+                logger.warning(f"Feed parsing error for {feed_name}: {e}")
+                parser = None
+
+        # Malformed XML (e.g. HTML entities): fall back to lenient feedparser,
+        # off the event loop so other fetches keep streaming meanwhile
+        if parser is None:
+            items = await asyncio.to_thread(
+                _parse_with_feedparser, b"".join(chunks), feed_name, credibility
+            )
+
+        # Only a successful parse is worth revalidating; caching validators
+        # for an empty result would make later 304s keep returning nothing
+        if feed_cache is not None:
+            if items:
+                feed_cache.update(feed_url, *validators, items)
+            else:
+                feed_cache.discard(feed_url)
 
         logger.info(f"Fetched {len(items)} items from {feed_name}")
         return items
@@ -70,6 +121,146 @@ async def fetch_rss_feed(
         return []
 
 
+def _drain_entries(
+    parser: ET.XMLPullParser,
+    items: list[NewsItem],
+    source_name: str,
+    credibility: float
+) -> None:
+    """
+    Parse completed RSS items / Atom entries from the pull parser and free them.
+
+    Args:
+        parser: XML pull parser fed with response chunks
+        items: List to append parsed NewsItem objects to
+        source_name: Name of the source
+        credibility: Source credibility score
+    """
+    for _, elem in parser.read_events():
+        if _local_name(elem.tag) not in ("item", "entry"):
+            continue
+
+        try:
+            news_item = _parse_entry_element(elem, source_name, credibility)
+            if news_item:
+                items.append(news_item)
+        except Exception as e:
+            logger.warning(f"Error parsing entry from {source_name}: {e}")
+        finally:
+            # Release the entry subtree once parsed
+            elem.clear()
+
+
+def _local_name(tag: str) -> str:
+    """Strip the XML namespace from a tag."""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _parse_entry_element(
+    elem: ET.Element,
+    source_name: str,
+    credibility: float
+) -> Optional[NewsItem]:
+    """
+    Parse an RSS <item> or Atom <entry> element into NewsItem.
+
+    Args:
+        elem: Entry element
+        source_name: Name of the source
+        credibility: Source credibility score
+
+    Returns:
+        NewsItem or None if required fields are missing
+    """
+    title = url = summary_raw = author = None
+    tags = []
+    dates = {}
+
+    for child in elem:
+        name = _local_name(child.tag)
+        text = (child.text or "").strip()
+
+        if name == "title":
+            title = text
+        elif name == "link":
+            # RSS puts the URL in the text, Atom in href (prefer rel=alternate)
+            if text:
+                url = url or text
+            elif child.get("rel", "alternate") == "alternate":
+                url = url or child.get("href")
+        elif name in ("description", "summary") and summary_raw is None:
+            summary_raw = child.text or ""
+        elif name in _DATE_TAGS:
+            dates.setdefault(name, text)
+        elif name in ("author", "creator") and author is None:
+            author_name = child.findtext("{http://www.w3.org/2005/Atom}name")
+            author = (author_name or text).strip() or None
+        elif name == "category":
+            term = child.get("term") or text
+            if term:
+                tags.append(term)
+
+    # Required fields
+    if not url or not title:
+        return None
+
+    summary_raw = summary_raw or ""
+
+    # Prefer publication date over update date, default to now
+    published_at = datetime.now()
+    published = next((dates[tag] for tag in _DATE_TAGS if dates.get(tag)), None)
+    if published:
+        try:
+            published_at = _parse_date_string(published)
+        except (ValueError, OverflowError):
+            pass
+
+    return NewsItem(
+        id=hashlib.blake2b(url.encode(), digest_size=16).hexdigest(),
+        source="rss",
+        source_name=source_name,
+        title=title,
+        url=url,
+        published_at=published_at,
+        author=author,
+        summary_raw=summary_raw,
+        content_snippet=_clean_html(summary_raw)[:500],
+        tags=tags,
+        engagement={"credibility": credibility}
+    )
+
+
+def _parse_with_feedparser(
+    content: bytes,
+    source_name: str,
+    credibility: float
+) -> list[NewsItem]:
+    """
+    Parse a feed with feedparser (lenient fallback for malformed XML).
+
+    Args:
+        content: Raw feed bytes
+        source_name: Name of the source
+        credibility: Source credibility score
+
+    Returns:
+        List of NewsItem objects
+    """
+    feed = feedparser.parse(content)
+
+    items = []
+    for entry in feed.entries:
+        try:
+            news_item = _parse_feed_entry(entry, source_name, credibility)
+            if news_item:
+                items.append(news_item)
+        except Exception as e:
+            logger.warning(f"Error parsing entry from {source_name}: {e}")
+            continue
+
+    return items
+
+
 def _parse_feed_entry(
     entry: feedparser.FeedParserDict,
     source_name: str,
@@ -86,36 +277,31 @@ def _parse_feed_entry(
     Returns:
         NewsItem or None if parsing fails
     """
-    # Required fields
-    if not hasattr(entry, "link") or not hasattr(entry, "title"):
+    # Required fields (FeedParserDict is a dict; .get skips its __getattr__ fallback)
+    url = entry.get("link")
+    title = entry.get("title")
+    if url is None or title is None:
         return None
 
-    url = entry.link
-    title = entry.title
-
     # Generate stable ID from URL
-    item_id = hashlib.md5(url.encode()).hexdigest()
+    item_id = hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
 
     # Parse published date
     published_at = _parse_date(entry)
 
     # Extract author
-    author = getattr(entry, "author", None)
+    author = entry.get("author")
 
     # Extract summary
-    summary_raw = ""
-    if hasattr(entry, "summary"):
-        summary_raw = entry.summary
-    elif hasattr(entry, "description"):
-        summary_raw = entry.description
+    summary_raw = entry.get("summary")
+    if summary_raw is None:
+        summary_raw = entry.get("description", "")
 
     # Content snippet (first 500 chars of summary, stripped of HTML)
     content_snippet = _clean_html(summary_raw)[:500]
 
     # Extract tags
-    tags = []
-    if hasattr(entry, "tags"):
-        tags = [tag.term for tag in entry.tags if hasattr(tag, "term")]
+    tags = [tag["term"] for tag in entry.get("tags", ()) if "term" in tag]
 
     # Create NewsItem
     news_item = NewsItem(
@@ -137,24 +323,28 @@ def _parse_feed_entry(
 
 def _parse_date(entry: feedparser.FeedParserDict) -> datetime:
     """Parse published date from feed entry."""
+    published_parsed = entry.get("published_parsed")
+    published = entry.get("published")
+    updated_parsed = entry.get("updated_parsed")
+
     # Try published_parsed first
-    if hasattr(entry, "published_parsed") and entry.published_parsed:
+    if published_parsed:
         try:
-            return datetime(*entry.published_parsed[:6])
+            return datetime(*published_parsed[:6])
         except Exception:
             pass
 
     # Try published string
-    if hasattr(entry, "published"):
+    if published is not None:
         try:
-            return date_parser.parse(entry.published)
+            return _parse_date_string(published)
         except Exception:
             pass
 
     # Try updated_parsed
-    if hasattr(entry, "updated_parsed") and entry.updated_parsed:
+    if updated_parsed:
         try:
-            return datetime(*entry.updated_parsed[:6])
+            return datetime(*updated_parsed[:6])
         except Exception:
             pass
 
@@ -162,14 +352,37 @@ def _parse_date(entry: feedparser.FeedParserDict) -> datetime:
     return datetime.now()
 
 
-def _clean_html(text: str) -> str:
-    """Remove HTML tags from text."""
-    import re
+@lru_cache(maxsize=4096)
+def _parse_date_string(value: str) -> datetime:
+    """
+    Parse a feed date string into a naive UTC datetime.
+
+    Tries the RFC 822 form used by RSS, then ISO 8601 used by Atom,
+    before falling back to dateutil's generic (and much slower) parser.
+
+    Raises:
+        ValueError: If the string can't be parsed
+    """
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            parsed = datetime.fromisoformat(value.strip())
+        except ValueError:
+            parsed = date_parser.parse(value)
+
+    # Match feedparser's *_parsed tuples, which are naive UTC
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+
+    return parsed
 
-    # Remove HTML tags
-    text = re.sub(r"<[^>]+>", "", text)
 
-    # Remove extra whitespace
-    text = re.sub(r"\s+", " ", text)
+def _clean_html(text: str) -> str:
+    """Remove HTML tags from text."""
+    # Plain text (no tags): just collapse whitespace, skipping the regex
+    if "<" not in text:
+        return " ".join(text.split())
 
-    return text.strip()
+    # Strip tags and collapse whitespace in a single pass
+    return _HTML_TAG_OR_SPACE_RE.sub(" ", text).strip()
@@ -2,39 +2,56 @@
 
 import asyncio
 import os
+from functools import cached_property
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from .config.settings import Settings
 from .utils.logging import setup_logging, get_logger
 from .utils.io import save_json, get_output_filename
 from .utils.schema import NewsItem
+from .utils.http import create_client
 
 from .ingestion.rss import fetch_rss_feed
+from .ingestion.feed_cache import FeedCache
+from .ingestion.arxiv import fetch_arxiv_papers
 from .ingestion.normalize import normalize_items
 from .ingestion.mock_data import generate_mock_data
 
 from .dedupe.embed import EmbeddingModel
 from .dedupe.dedupe import Deduplicator
+from .dedupe.cache import EmbeddingCache
 
 from .rank.select import (
-    filter_by_time_window,
     rank_stories,
     select_top_stories,
     select_secondary_stories
 )
 
 from .summarize.llm import LLMClient
+from .summarize.cache import CompletionCache
 from .summarize.summarize import summarize_stories, generate_newsletter_intro
 
 from .render.beehiiv_md import render_newsletter, save_newsletter
-from .render.pdf_export import export_to_pdf
-from .utils.email import send_newsletter_email
+from .utils.email import send_newsletter_broadcast
 
 
 logger = get_logger("main")
 
 
+def _export_pdf(*args, **kwargs) -> None:
+    """
+    Export the PDF edition, importing ReportLab on first use.
+
+    ReportLab takes ~100ms to import, so it's deferred until a PDF is
+    built (in the worker thread that builds it), not paid at CLI startup.
+    Arguments are passed through to export_to_pdf.
+    """
+    from .render.pdf_export import export_to_pdf
+
+    export_to_pdf(*args, **kwargs)
+
+
 class NeuralExpress:
     """Main pipeline for Neural Express."""
 
@@ -60,6 +77,38 @@ class NeuralExpress:
 
         logger.info("Initialized Neural Express pipeline")
 
+    @cached_property
+    def embedding_model(self) -> EmbeddingModel:
+        """Embedding model, loaded on first use and reused across runs."""
+        return EmbeddingModel(self.settings.embedding_model)
+
+    @cached_property
+    def embedding_cache(self) -> EmbeddingCache:
+        """On-disk embedding cache, loaded on first use and reused across runs."""
+        return EmbeddingCache(
+            self.settings.output_dir / "embed_cache.npz",
+            self.settings.embedding_model
+        )
+
+    @cached_property
+    def completion_cache(self) -> CompletionCache:
+        """On-disk LLM completion cache, loaded on first use and reused across runs."""
+        return CompletionCache(
+            self.settings.output_dir / "llm_cache.pkl",
+            ttl_seconds=self.settings.get("llm.cache_ttl_hours", 168) * 3600
+        )
+
+    @cached_property
+    def llm_client(self) -> LLMClient:
+        """LLM client, created on first use and reused across runs."""
+        return LLMClient(
+            api_key=self.settings.openai_api_key,
+            model=self.settings.llm_model,
+            temperature=self.settings.llm_temperature,
+            cache=self.completion_cache,
+            max_retries=self.settings.get("llm.max_retries", 4)
+        )
+
     async def run(self, mode: str = "daily", use_mock: bool = False) -> str:
         """
         Run the complete pipeline.
@@ -85,12 +134,9 @@ class NeuralExpress:
 
         logger.info(f"Ingested {len(items)} total items")
 
-        # Normalize
-        items = normalize_items(items)
-
-        # 2. Time filtering
+        # 2. Normalization and time filtering (one pass)
         logger.info("=" * 50)
-        logger.info("STEP 2: Time Filtering")
+        logger.info("STEP 2: Normalization & Time Filtering")
         logger.info("=" * 50)
 
         time_window = (
@@ -99,20 +145,21 @@ class NeuralExpress:
             else self.settings.get("time_windows.weekly", 168)
         )
 
-        items = filter_by_time_window(items, time_window)
+        cutoff = datetime.now() - timedelta(hours=time_window)
+        items = normalize_items(items, cutoff=cutoff)
 
         # 3. Deduplication
         logger.info("=" * 50)
         logger.info("STEP 3: Deduplication")
         logger.info("=" * 50)
 
-        embedding_model = EmbeddingModel(self.settings.embedding_model)
         story_chain_threshold = self.settings.get("dedupe.story_chain_threshold", 0.75)
 
         deduplicator = Deduplicator(
-            embedding_model,
+            self.embedding_model,
             threshold=self.settings.dedupe_threshold,
-            story_chain_threshold=story_chain_threshold
+            story_chain_threshold=story_chain_threshold,
+            embedding_cache=self.embedding_cache
         )
 
         # Use smart deduplication for weekly mode
@@ -129,7 +176,12 @@ class NeuralExpress:
             items,
             self.settings.ranking_weights,
             time_window,
-            relevance_keywords
+            relevance_keywords,
+            # Selection only ever reads this many stories from the top
+            limit=(
+                self.settings.top_stories_count
+                + self.settings.secondary_stories_count
+            )
         )
 
         # 5. Selection
@@ -155,16 +207,20 @@ class NeuralExpress:
         logger.info("STEP 6: Summarization")
         logger.info("=" * 50)
 
-        llm_client = LLMClient(
-            api_key=self.settings.openai_api_key,
-            model=self.settings.llm_model,
-            temperature=self.settings.llm_temperature
+        top_stories = await summarize_stories(
+            top_stories,
+            self.llm_client,
+            max_concurrency=self.settings.get("llm.max_concurrent_requests", 8),
+            cache=self.completion_cache
         )
 
-        top_stories = await summarize_stories(top_stories, llm_client)
-
         # Generate intro
-        intro = generate_newsletter_intro(top_stories, llm_client)
+        intro = generate_newsletter_intro(top_stories, self.llm_client)
+
+        try:
+            self.completion_cache.save()
+        except OSError as e:
+            logger.warning(f"Failed to save completion cache: {e}")
 
         # Extract story chains for weekly mode
         story_chains = None
@@ -176,12 +232,33 @@ class NeuralExpress:
         logger.info("STEP 7: Rendering")
         logger.info("=" * 50)
 
+        # One timestamp for both the markdown and PDF editions
+        render_time = datetime.now()
+
+        output_filename = get_output_filename(mode, "md")
+        output_path = self.settings.output_dir / output_filename
+        pdf_path = output_path.with_suffix(".pdf")
+
+        # PDF layout is the slow part; build it in a worker thread while the
+        # markdown edition is rendered and saved
+        pdf_task = asyncio.create_task(asyncio.to_thread(
+            _export_pdf,
+            top_stories,
+            secondary_stories,
+            intro,
+            pdf_path,
+            mode,
+            story_chains,
+            render_time=render_time
+        ))
+
         newsletter = render_newsletter(
             top_stories,
             secondary_stories,
             intro,
             mode,
-            story_chains
+            story_chains,
+            render_time=render_time
         )
 
         # 8. Save
@@ -189,23 +266,12 @@ class NeuralExpress:
         logger.info("STEP 8: Saving Output")
         logger.info("=" * 50)
 
-        output_filename = get_output_filename(mode, "md")
-        output_path = self.settings.output_dir / output_filename
-
         # Save markdown
         save_newsletter(newsletter, str(output_path))
 
-        # Save PDF
-        pdf_path = output_path.with_suffix(".pdf")
+        # Wait for PDF
         try:
-            export_to_pdf(
-                top_stories,
-                secondary_stories,
-                intro,
-                pdf_path,
-                mode,
-                story_chains
-            )
+            await pdf_task
         except Exception as e:
             logger.error(f"Failed to generate PDF: {e}")
 
@@ -228,8 +294,12 @@ class NeuralExpress:
             logger.info("STEP 9: Email Delivery")
             logger.info("=" * 50)
 
-            recipient = os.environ.get("EMAIL_RECIPIENT")
-            if recipient:
+            recipients = [
+                address.strip()
+                for address in os.environ.get("EMAIL_RECIPIENT", "").split(",")
+                if address.strip()
+            ]
+            if recipients:
                 subject_template = self.settings.get(
                     "email.subject_template",
                     "NEURAL EXPRESS Weekly - {date}"
@@ -239,17 +309,18 @@ class NeuralExpress:
                 )
 
                 pdf_attachment = str(pdf_path) if pdf_path.exists() else None
-                success = send_newsletter_email(
-                    to_email=recipient,
+                success = send_newsletter_broadcast(
+                    recipients=recipients,
                     subject=subject,
                     body_text=newsletter,
                     pdf_path=pdf_attachment,
+                    batch_size=self.settings.get("email.batch_size", 50),
                 )
 
                 if success:
-                    logger.info(f"Newsletter emailed to {recipient}")
+                    logger.info(f"Newsletter emailed to {', '.join(recipients)}")
                 else:
-                    logger.error(f"Failed to email newsletter to {recipient}")
+                    logger.error(f"Failed to email newsletter to {', '.join(recipients)}")
             else:
                 logger.warning("EMAIL_RECIPIENT not set, skipping email delivery")
 
@@ -261,22 +332,59 @@ class NeuralExpress:
         return str(output_path)
 
     async def _fetch_all_feeds(self) -> list[NewsItem]:
-        """Fetch all RSS feeds."""
+        """Fetch all RSS feeds (and arXiv, if enabled) concurrently."""
         feeds = self.settings.feeds
+        include_arxiv = self.settings.get("arxiv.enabled", False)
+
+        logger.info(
+            f"Fetching {len(feeds)} RSS feeds"
+            + (" and arXiv" if include_arxiv else "")
+        )
+
+        feed_cache = FeedCache(self.settings.output_dir / "feed_cache.pkl")
 
-        logger.info(f"Fetching {len(feeds)} RSS feeds")
+        # Cap in-flight fetches so parsing doesn't all land at once
+        semaphore = asyncio.Semaphore(
+            self.settings.get("processing.max_concurrent_fetches", 10)
+        )
 
-        tasks = [fetch_rss_feed(feed) for feed in feeds]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        async def bounded(coro):
+            async with semaphore:
+                return await coro
+
+        # One pooled HTTP/2 client shared by every source
+        async with create_client() as client:
+            source_names = [feed["name"] for feed in feeds]
+            tasks = [
+                bounded(fetch_rss_feed(feed, client=client, feed_cache=feed_cache))
+                for feed in feeds
+            ]
+
+            if include_arxiv:
+                source_names.append("arXiv")
+                tasks.append(bounded(fetch_arxiv_papers(
+                    query=self.settings.get(
+                        "arxiv.query", "cat:cs.AI OR cat:cs.LG OR cat:cs.CL"
+                    ),
+                    max_results=self.settings.get("arxiv.max_results", 50),
+                    client=client
+                )))
+
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        try:
+            feed_cache.save()
+        except OSError as e:
+            logger.warning(f"Failed to save feed cache: {e}")
 
         # Collect items, log errors
         all_items = []
         errors = []
 
-        for feed, result in zip(feeds, results):
+        for source_name, result in zip(source_names, results):
             if isinstance(result, Exception):
-                logger.error(f"Failed to fetch {feed['name']}: {result}")
-                errors.append(feed["name"])
+                logger.error(f"Failed to fetch {source_name}: {result}")
+                errors.append(source_name)
             else:
                 all_items.extend(result)
 
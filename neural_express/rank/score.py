@@ -1,17 +1,97 @@
 """Scoring functions for ranking news items."""
 
 from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Optional
+import math
 import re
+import numpy as np
 
 from ..utils.schema import NewsItem
 from ..utils.logging import get_logger
 
 logger = get_logger("rank.score")
 
+# Recency half-life after the time window, as a fraction of the window
+RECENCY_DECAY_RATE = 0.1
+
+
+def _recency_decay_coef(time_window_hours: int) -> float:
+    """Exponent coefficient so exp(excess_hours * coef) halves every half-life."""
+    return math.log(0.5) / (time_window_hours * RECENCY_DECAY_RATE)
+
+
+@lru_cache(maxsize=32)
+def _compile_keywords(
+    keywords: tuple[str, ...]
+) -> tuple[re.Pattern, dict[str, frozenset[int]]]:
+    """
+    Compile keywords into a single alternation regex.
+
+    The pattern is a lookahead tried at every position with the longest
+    keywords first, so any keyword starting at a position is a prefix of
+    the one reported there. Each reported keyword maps to the indices of
+    every keyword it contains, which recovers exact substring semantics.
+
+    Args:
+        keywords: Relevance keywords
+
+    Returns:
+        Tuple of (pattern, implied keyword indices per lowercased keyword)
+    """
+    lowered = [keyword.lower() for keyword in keywords]
+    ordered = sorted(set(lowered), key=len, reverse=True)
+
+    pattern = re.compile("(?=(" + "|".join(map(re.escape, ordered)) + "))")
+    implied = {
+        keyword: frozenset(i for i, other in enumerate(lowered) if other in keyword)
+        for keyword in ordered
+    }
+
+    return pattern, implied
+
+
+@lru_cache(maxsize=8192)
+def _searchable_text(title: str, content_snippet: str) -> str:
+    """
+    Lowercased title and snippet, shared by text-based scorers.
+
+    Keyed on the strings themselves, so edits to an item can't go stale.
+
+    Args:
+        title: Item title
+        content_snippet: Item content snippet
+
+    Returns:
+        Lowercased "title snippet" text
+    """
+    return f"{title} {content_snippet}".lower()
+
+
+def _count_keyword_matches(text: str, keywords: tuple[str, ...]) -> int:
+    """
+    Count keywords that occur in lowercased text, in a single scan.
+
+    Args:
+        text: Lowercased text
+        keywords: Relevance keywords
+
+    Returns:
+        Number of keywords present in text
+    """
+    pattern, implied = _compile_keywords(keywords)
+
+    found = set()
+    for keyword in set(pattern.findall(text)):
+        found |= implied[keyword]
+
+    return len(found)
+
 
 def calculate_recency_score(
     item: NewsItem,
-    time_window_hours: int = 24
+    time_window_hours: int = 24,
+    now: Optional[datetime] = None
 ) -> float:
     """
     Calculate recency score (1.0 if within window, decay after).
@@ -19,11 +99,13 @@ def calculate_recency_score(
     Args:
         item: News item
         time_window_hours: Time window in hours (24 for daily, 168 for weekly)
+        now: Reference time (defaults to the current time)
 
     Returns:
         Score between 0 and 1
     """
-    now = datetime.now()
+    if now is None:
+        now = datetime.now()
     age_hours = (now - item.published_at).total_seconds() / 3600
 
     if age_hours < 0:
@@ -33,9 +115,8 @@ def calculate_recency_score(
         return 1.0
 
     # Exponential decay after time window
-    decay_rate = 0.1
     excess_hours = age_hours - time_window_hours
-    score = 1.0 * (0.5 ** (excess_hours / (time_window_hours * decay_rate)))
+    score = math.exp(excess_hours * _recency_decay_coef(time_window_hours))
 
     return max(0.0, min(1.0, score))
 
@@ -101,18 +182,14 @@ def calculate_relevance_score(
         Score between 0 and 1
     """
     # Combine title and content for analysis
-    text = f"{item.title} {item.content_snippet}".lower()
+    text = _searchable_text(item.title, item.content_snippet)
 
-    # Count keyword matches
-    matches = 0
-    for keyword in keywords:
-        if keyword.lower() in text:
-            matches += 1
-
-    # Calculate density
     if not keywords:
         return 0.5
 
+    # Count keyword matches
+    matches = _count_keyword_matches(text, tuple(keywords))
+
     density = matches / len(keywords)
 
     # Normalize to 0-1 range (cap at 5 matches)
@@ -125,22 +202,26 @@ def calculate_composite_score(
     item: NewsItem,
     weights: dict,
     time_window_hours: int,
-    relevance_keywords: list[str]
+    relevance_keywords: list[str],
+    now: Optional[datetime] = None
 ) -> dict:
     """
     Calculate composite score with all components.
 
+    Single-item form; rank_stories scores in bulk with calculate_composite_scores.
+
     Args:
         item: News item
         weights: Weight dict with keys: recency, credibility, engagement, uniqueness, relevance
         time_window_hours: Time window for recency calculation
         relevance_keywords: Keywords for relevance scoring
+        now: Reference time for recency (defaults to the current time)
 
     Returns:
         Dict with overall score and component scores
     """
     # Calculate component scores
-    recency = calculate_recency_score(item, time_window_hours)
+    recency = calculate_recency_score(item, time_window_hours, now)
     credibility = calculate_credibility_score(item)
     engagement = calculate_engagement_score(item)
     uniqueness = calculate_uniqueness_score(item)
@@ -163,3 +244,86 @@ def calculate_composite_score(
         "uniqueness_score": uniqueness,
         "relevance_score": relevance
     }
+
+
+def calculate_composite_scores(
+    items: list[NewsItem],
+    weights: dict,
+    time_window_hours: int,
+    relevance_keywords: list[str],
+    now: Optional[datetime] = None
+) -> dict[str, np.ndarray]:
+    """
+    Calculate composite scores for many items at once.
+
+    Vectorized equivalent of calling calculate_composite_score per item.
+
+    Args:
+        items: List of news items
+        weights: Weight dict with keys: recency, credibility, engagement, uniqueness, relevance
+        time_window_hours: Time window for recency calculation
+        relevance_keywords: Keywords for relevance scoring
+        now: Reference time for recency (defaults to the current time)
+
+    Returns:
+        Dict of score arrays (shape: [len(items)]), keyed like calculate_composite_score
+    """
+    if now is None:
+        now = datetime.now()
+    n = len(items)
+
+    published = np.fromiter(
+        (item.published_at.timestamp() for item in items), dtype=np.float64, count=n
+    )
+    credibility = np.fromiter(
+        (item.engagement.get("credibility", 0.5) for item in items),
+        dtype=np.float64,
+        count=n
+    )
+    # Cluster sizes are fixed after deduplication; read once per item
+    cluster_size = np.fromiter(
+        (len(item.duplicates) + 1 for item in items), dtype=np.int32, count=n
+    )
+
+    # Recency: 1.0 within window, exponential decay after
+    age_hours = np.maximum((now.timestamp() - published) / 3600, 0.0)
+    excess_hours = np.maximum(age_hours - time_window_hours, 0.0)
+    recency = np.clip(
+        np.exp(excess_hours * _recency_decay_coef(time_window_hours)), 0.0, 1.0
+    )
+
+    engagement = np.full(n, 0.5)
+    uniqueness = 1.0 / cluster_size
+
+    if relevance_keywords:
+        keywords = tuple(relevance_keywords)
+        matches = np.fromiter(
+            (
+                _count_keyword_matches(
+                    _searchable_text(item.title, item.content_snippet), keywords
+                )
+                for item in items
+            ),
+            dtype=np.float64,
+            count=n
+        )
+        relevance = np.minimum(1.0, matches / len(keywords) * 2)
+    else:
+        relevance = np.full(n, 0.5)
+
+    score = (
+        weights.get("recency", 0.3) * recency +
+        weights.get("credibility", 0.25) * credibility +
+        weights.get("engagement", 0.15) * engagement +
+        weights.get("uniqueness", 0.15) * uniqueness +
+        weights.get("relevance", 0.15) * relevance
+    )
+
+    return {
+        "score": score,
+        "recency_score": recency,
+        "credibility_score": credibility,
+        "engagement_score": engagement,
+        "uniqueness_score": uniqueness,
+        "relevance_score": relevance
+    }
@@ -1,8 +1,12 @@
 """Story selection logic."""
 
+from datetime import datetime
+from typing import Optional
+import numpy as np
+
 from ..utils.schema import NewsItem, RankedStory
 from ..utils.logging import get_logger
-from .score import calculate_composite_score
+from .score import calculate_composite_scores
 
 logger = get_logger("rank.select")
 
@@ -11,7 +15,8 @@ def rank_stories(
     items: list[NewsItem],
     weights: dict,
     time_window_hours: int,
-    relevance_keywords: list[str]
+    relevance_keywords: list[str],
+    limit: Optional[int] = None
 ) -> list[RankedStory]:
     """
     Rank news items by composite score.
@@ -21,41 +26,62 @@ def rank_stories(
         weights: Ranking weight dict
         time_window_hours: Time window for recency calculation
         relevance_keywords: Keywords for relevance scoring
+        limit: If given, only rank the top `limit` stories (partial selection
+            instead of a full sort)
 
     Returns:
         List of RankedStory objects, sorted by score (descending)
     """
     logger.info(f"Ranking {len(items)} stories")
 
-    ranked = []
+    scores = calculate_composite_scores(
+        items,
+        weights,
+        time_window_hours,
+        relevance_keywords,
+        now=datetime.now()
+    )
 
-    for item in items:
-        scores = calculate_composite_score(
-            item,
-            weights,
-            time_window_hours,
-            relevance_keywords
+    score = scores["score"]
+    candidates = np.arange(len(items))
+
+    if limit is not None and limit <= 0:
+        candidates = candidates[:0]
+    elif limit is not None and limit < len(items):
+        # Partition around the limit-th best score, keeping earliest ties
+        kth = np.partition(score, len(score) - limit)[len(score) - limit]
+        above = np.flatnonzero(score > kth)
+        ties = np.flatnonzero(score == kth)[:limit - len(above)]
+        candidates = np.sort(np.concatenate([above, ties]))
+
+    # Sort by score (descending), keeping input order for ties
+    order = candidates[np.argsort(-score[candidates], kind="stable")]
+    ranked = [
+        RankedStory(
+            news_item=items[i],
+            score=total,
+            recency_score=recency,
+            credibility_score=credibility,
+            engagement_score=engagement,
+            uniqueness_score=uniqueness,
+            relevance_score=relevance
         )
-
-        ranked_story = RankedStory(
-            news_item=item,
-            score=scores["score"],
-            recency_score=scores["recency_score"],
-            credibility_score=scores["credibility_score"],
-            engagement_score=scores["engagement_score"],
-            uniqueness_score=scores["uniqueness_score"],
-            relevance_score=scores["relevance_score"]
+        for i, total, recency, credibility, engagement, uniqueness, relevance in zip(
+            order.tolist(),
+            score[order].tolist(),
+            scores["recency_score"][order].tolist(),
+            scores["credibility_score"][order].tolist(),
+            scores["engagement_score"][order].tolist(),
+            scores["uniqueness_score"][order].tolist(),
+            scores["relevance_score"][order].tolist()
         )
+    ]
 
-        ranked.append(ranked_story)
-
-    # Sort by score (descending)
-    ranked.sort(key=lambda x: x.score, reverse=True)
-
-    logger.info(
-        f"Ranked stories - Top score: {ranked[0].score:.3f}, "
-        f"Bottom score: {ranked[-1].score:.3f}"
-    )
+    if items:
+        logger.info(
+            f"Ranked stories - Top score: {score.max():.3f}, "
+            f"Bottom score: {score.min():.3f}"
+        )
 
     return ranked
 
@@ -142,11 +168,11 @@ def filter_by_time_window(
     Returns:
         Filtered list of news items
     """
-    from datetime import datetime, timedelta
+    cutoff_ts = datetime.now().timestamp() - time_window_hours * 3600
 
-    cutoff = datetime.now() - timedelta(hours=time_window_hours)
-
-    filtered = [item for item in items if item.published_at >= cutoff]
+    filtered = [
+        item for item in items if item.published_at.timestamp() >= cutoff_ts
+    ]
 
     logger.info(
         f"Filtered to {len(filtered)} items within {time_window_hours}h "
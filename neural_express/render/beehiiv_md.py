@@ -1,6 +1,7 @@
 """Beehiiv-compatible markdown newsletter renderer."""
 
 from datetime import datetime
+from functools import cache
 from typing import Optional
 from ..utils.schema import RankedStory
 from ..utils.logging import get_logger
@@ -23,20 +24,34 @@ from .templates import (
     PLACEHOLDER_TOOLS,
     get_category_emoji,
     get_date_range,
-    format_toc_item,
-    format_source_list,
-    format_details_list
+    format_source_items,
+    unique_sources,
+    format_details_list,
+    format_short_date,
+    compile_template,
+    STORY_DATE_KEY
 )
 
 logger = get_logger("render")
 
+# Templates parsed once at import; each renders from keyword arguments
+_HEADER = compile_template(NEWSLETTER_HEADER)
+_MAIN_STORY = compile_template(MAIN_STORY_TEMPLATE)
+_QUICK_BITE = compile_template(QUICK_BITE_ITEM)
+_TIMELINE_ENTRY = compile_template(DEVELOPING_STORY_TIMELINE_ENTRY)
+_STORY_CHAIN = compile_template(DEVELOPING_STORY_CHAIN)
+_JOB = compile_template(JOB_ITEM)
+_TOOL = compile_template(TOOL_ITEM)
+_FOOTER = compile_template(NEWSLETTER_FOOTER)
+
 
 def render_newsletter(
     top_stories: list[RankedStory],
     secondary_stories: list[RankedStory],
     intro: str,
     mode: str = "daily",
-    story_chains: Optional[dict] = None
+    story_chains: Optional[dict] = None,
+    render_time: Optional[datetime] = None
 ) -> str:
     """
     Render complete newsletter with all 9 sections.
@@ -47,109 +62,123 @@ def render_newsletter(
         intro: Newsletter introduction text
         mode: "daily" or "weekly"
         story_chains: Optional dict of story chains (chain_id -> list of stories)
+        render_time: Issue date for the header (defaults to the current time)
 
     Returns:
         Complete newsletter markdown
     """
     logger.info(
-        f"Rendering newsletter with {len(top_stories)} main stories "
-        f"and {len(secondary_stories)} secondary stories"
+        "Rendering newsletter with %d main stories and %d secondary stories",
+        len(top_stories), len(secondary_stories)
     )
 
-    sections = []
+    # Every section appends raw fragments; the newsletter is joined once
+    fragments: list[str] = []
 
     # Section 1: HEADER
-    header = _render_header(intro, mode)
-    sections.append(header)
+    fragments.append(_render_header(intro, mode, render_time or datetime.now()))
 
     # Section 2: IN THIS ISSUE
-    in_this_issue = _render_in_this_issue(top_stories)
-    sections.append(in_this_issue)
+    fragments.extend(_render_in_this_issue(top_stories))
+
+    # Section 3: TOP STORIES (stories keep their TOC numbers when others are skipped)
+    numbered_stories = [
+        (i, story) for i, story in enumerate(top_stories, 1) if story.summary
+    ]
+    if len(numbered_stories) < len(top_stories):
+        logger.warning(
+            "Skipping %d main stories without summaries",
+            len(top_stories) - len(numbered_stories)
+        )
 
-    # Section 3: TOP STORIES
-    sections.append("## TOP STORIES\n")
-    for i, story in enumerate(top_stories, 1):
-        story_section = _render_main_story(story, i)
-        if story_section:
-            sections.append(story_section)
+    fragments.append("## TOP STORIES\n")
+    fragments.extend(_render_main_story(story, i) for i, story in numbered_stories)
 
     # Section 4: QUICK BITES
     if secondary_stories:
-        quick_bites = _render_quick_bites(secondary_stories)
-        sections.append(quick_bites)
+        fragments.extend(_render_quick_bites(secondary_stories))
 
     # Section 5: DEVELOPING STORIES
     if mode == "weekly" and story_chains:
-        developing = _render_developing_stories(story_chains)
-        sections.append(developing)
+        fragments.extend(_render_developing_stories(story_chains))
 
     # Section 6: TOP AI JOBS
-    jobs = _render_jobs()
-    sections.append(jobs)
+    fragments.extend(_render_jobs())
 
     # Section 7: TRENDING AI TOOLS
-    tools = _render_tools()
-    sections.append(tools)
+    fragments.extend(_render_tools())
 
     # Section 8: SOURCES
-    all_stories = top_stories + secondary_stories
-    sources = _render_sources(all_stories)
-    sections.append(sources)
+    fragments.extend(_render_sources(top_stories + secondary_stories))
 
     # Section 9: FOOTER
-    footer = _render_footer()
-    sections.append(footer)
+    fragments.append(_render_footer())
 
     # Combine
-    newsletter = "\n".join(sections)
+    newsletter = "\n".join(fragments)
 
-    logger.info(f"Rendered newsletter ({len(newsletter)} characters)")
+    logger.info("Rendered newsletter (%d characters)", len(newsletter))
 
     return newsletter
 
 
-def _render_header(intro: str, mode: str) -> str:
+def _wrap_fragments(template: str, field: str, items: list[str]) -> list[str]:
+    """
+    Surround newline-separated items with a section template's text.
+
+    Equivalent to template.format(field="\\n".join(items)) when the result
+    is itself newline-joined, but without building the inner string.
+
+    Args:
+        template: Section template with a single {field} placeholder on its own line
+        field: Placeholder name
+        items: Lines that would have been newline-joined into the placeholder
+
+    Returns:
+        List of fragments to be newline-joined by the caller
+    """
+    head, _, tail = template.partition("{" + field + "}")
+    return [head[:-1], *(items or [""]), tail[1:]]
+
+
+def _render_header(intro: str, mode: str, render_time: datetime) -> str:
     """Render newsletter header with date range and greeting."""
-    date_range = get_date_range(mode)
+    date_range = get_date_range(mode, render_time)
 
-    return NEWSLETTER_HEADER.format(
+    return _HEADER(
         date_range=date_range,
         wave="\U0001f44b",
         intro=intro
     )
 
 
-def _render_in_this_issue(stories: list[RankedStory]) -> str:
+def _render_in_this_issue(stories: list[RankedStory]) -> list[str]:
     """Render IN THIS ISSUE numbered headlines."""
     toc_items = []
     for i, story in enumerate(stories, 1):
-        if story.summary:
-            headline = story.summary.headline
-            category = story.summary.category
+        summary = story.summary
+        if summary:
+            headline = summary.headline
+            category = summary.category
         else:
             headline = story.news_item.title
             category = "News"
 
-        toc_items.append(format_toc_item(headline, i, category))
-
-    numbered_headlines = "\n".join(toc_items)
+        # Inlined format_toc_item
+        toc_items.append(f"{i}. {get_category_emoji(category)} {headline} [{category}]")
 
-    return IN_THIS_ISSUE_SECTION.format(numbered_headlines=numbered_headlines)
+    return _wrap_fragments(IN_THIS_ISSUE_SECTION, "numbered_headlines", toc_items)
 
 
 def _render_main_story(story: RankedStory, story_number: int) -> str:
-    """Render a main story with full details."""
+    """Render a main story with full details (the story must have a summary)."""
     item = story.news_item
     summary = story.summary
 
-    if not summary:
-        logger.warning(f"Story missing summary: {item.title[:50]}")
-        return ""
-
     category_emoji = get_category_emoji(summary.category)
     details = format_details_list(summary.details)
 
-    return MAIN_STORY_TEMPLATE.format(
+    return _MAIN_STORY(
         story_number=story_number,
         category_emoji=category_emoji,
         headline=summary.headline,
@@ -162,35 +191,32 @@ def _render_main_story(story: RankedStory, story_number: int) -> str:
     )
 
 
-def _render_quick_bites(stories: list[RankedStory]) -> str:
+def _render_quick_bites(stories: list[RankedStory]) -> list[str]:
     """Render quick bites section."""
     story_items = []
 
     for story in stories:
         item = story.news_item
+        summary = story.summary
 
-        if story.summary:
-            headline = story.summary.headline
-            snippet = story.summary.hook[:150]
+        if summary:
+            headline = summary.headline
+            snippet = summary.hook[:150]
         else:
             headline = item.title
             snippet = item.content_snippet[:150]
 
-        story_item = QUICK_BITE_ITEM.format(
+        story_items.append(_QUICK_BITE(
             headline=headline,
             snippet=snippet,
             source=item.source_name,
             url=item.url
-        )
-
-        story_items.append(story_item)
-
-    stories_text = "\n".join(story_items)
+        ))
 
-    return QUICK_BITES_SECTION.format(stories=stories_text)
+    return _wrap_fragments(QUICK_BITES_SECTION, "stories", story_items)
 
 
-def _render_developing_stories(story_chains: dict) -> str:
+def _render_developing_stories(story_chains: dict) -> list[str]:
     """Render developing stories with timelines."""
     chain_sections = []
 
@@ -199,7 +225,7 @@ def _render_developing_stories(story_chains: dict) -> str:
             continue
 
         # Sort by date
-        sorted_stories = sorted(stories, key=lambda s: s.news_item.published_at)
+        sorted_stories = sorted(stories, key=STORY_DATE_KEY)
 
         # Chain title from first story
         first = sorted_stories[0]
@@ -208,14 +234,13 @@ def _render_developing_stories(story_chains: dict) -> str:
         # Build timeline
         timeline_entries = []
         for story in sorted_stories:
-            date_str = story.news_item.published_at.strftime("%b %d")
-            headline = story.summary.headline if story.summary else story.news_item.title
-            source = story.news_item.source_name
-
-            entry = DEVELOPING_STORY_TIMELINE_ENTRY.format(
-                date=date_str,
-                headline=headline,
-                source=source
+            item = story.news_item
+            summary = story.summary
+
+            entry = _TIMELINE_ENTRY(
+                date=format_short_date(item.published_at),
+                headline=summary.headline if summary else item.title,
+                source=item.source_name
             )
             timeline_entries.append(entry)
 
@@ -228,69 +253,55 @@ def _render_developing_stories(story_chains: dict) -> str:
             else f"This developing story from {latest.news_item.source_name} continues to evolve."
         )
 
-        chain_section = DEVELOPING_STORY_CHAIN.format(
+        chain_section = _STORY_CHAIN(
             chain_title=chain_title,
             timeline=timeline,
             significance=significance
         )
+        # Chains are separated by a blank line
+        if chain_sections:
+            chain_sections.append("")
         chain_sections.append(chain_section)
 
     if not chain_sections:
-        return ""
-
-    chains_text = "\n\n".join(chain_sections)
+        return []
 
-    return DEVELOPING_STORIES_SECTION.format(chains=chains_text)
+    return _wrap_fragments(DEVELOPING_STORIES_SECTION, "chains", chain_sections)
 
 
-def _render_jobs() -> str:
-    """Render top AI jobs section."""
-    job_items = []
-    for title, company, location, description in PLACEHOLDER_JOBS:
-        job_items.append(JOB_ITEM.format(
-            title=title,
-            company=company,
-            location=location,
-            description=description
-        ))
+@cache
+def _render_jobs() -> tuple[str, ...]:
+    """Render top AI jobs section (constant, so rendered once)."""
+    job_items = [
+        _JOB(title=title, company=company, location=location, description=description)
+        for title, company, location, description in PLACEHOLDER_JOBS
+    ]
 
-    jobs_text = "\n".join(job_items)
-    return JOBS_SECTION.format(jobs=jobs_text)
+    return tuple(_wrap_fragments(JOBS_SECTION, "jobs", job_items))
 
 
-def _render_tools() -> str:
-    """Render trending AI tools section."""
-    tool_items = []
-    for name, description, url in PLACEHOLDER_TOOLS:
-        tool_items.append(TOOL_ITEM.format(
-            name=name,
-            description=description,
-            url=url
-        ))
+@cache
+def _render_tools() -> tuple[str, ...]:
+    """Render trending AI tools section (constant, so rendered once)."""
+    tool_items = [
+        _TOOL(name=name, description=description, url=url)
+        for name, description, url in PLACEHOLDER_TOOLS
+    ]
 
-    tools_text = "\n".join(tool_items)
-    return TOOLS_SECTION.format(tools=tools_text)
+    return tuple(_wrap_fragments(TOOLS_SECTION, "tools", tool_items))
 
 
-def _render_sources(stories: list[RankedStory]) -> str:
+def _render_sources(stories: list[RankedStory]) -> list[str]:
     """Render sources section."""
-    sources = []
-    seen_urls = set()
-
-    for story in stories:
-        item = story.news_item
-        if item.url not in seen_urls:
-            sources.append((item.source_name, item.url))
-            seen_urls.add(item.url)
-
-    sources_text = format_source_list(sources)
+    sources = unique_sources(stories)
 
-    return SOURCES_SECTION.format(sources=sources_text)
+    return _wrap_fragments(SOURCES_SECTION, "sources", format_source_items(sources))
 
 
+@cache
 def _render_footer() -> str:
-    """Render newsletter footer."""
-    return NEWSLETTER_FOOTER.format(
+    """Render newsletter footer (constant, so rendered once)."""
+    return _FOOTER(
         wave="\U0001f44b",
         copyright="\u00a9"
     )
@@ -312,4 +323,4 @@ def save_newsletter(
 
     save_markdown(newsletter, Path(filepath))
 
-    logger.info(f"Saved newsletter to {filepath}")
+    logger.info("Saved newsletter to %s", filepath)
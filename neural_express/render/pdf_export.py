@@ -1,12 +1,14 @@
 """PDF export for Neural Express newsletters."""
 
-from datetime import datetime, timedelta
+from datetime import datetime
+from functools import cache
+from io import BytesIO
 from pathlib import Path
-from typing import Optional, List
+from typing import BinaryIO, Optional, List, Union
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle, StyleSheet1
 from reportlab.lib.units import inch
 from reportlab.platypus import (
     SimpleDocTemplate,
@@ -22,6 +24,14 @@ from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
 
 from ..utils.schema import RankedStory
 from ..utils.logging import get_logger
+from .templates import (
+    unique_sources,
+    get_date_range,
+    format_short_date,
+    STORY_DATE_KEY,
+    PLACEHOLDER_JOBS,
+    PLACEHOLDER_TOOLS
+)
 
 logger = get_logger("render.pdf")
 
@@ -52,15 +62,39 @@ CATEGORY_COLORS = {
     "Creative AI": colors.HexColor('#ff6f61'),
 }
 
+# Fallback category color and divider rule color, built once
+DEFAULT_CATEGORY_COLOR = colors.HexColor('#333333')
+DIVIDER_COLOR = colors.HexColor('#e0e0e0')
+
+# Headline label and colored meta tag for each known category, built once
+CATEGORY_MARKUP = {
+    category: (label, f"<font color='{CATEGORY_COLORS[category]}'><b>{category}</b></font>")
+    for category, label in CATEGORY_LABELS.items()
+}
+
+# Parsed paragraph fragments for constant markup, keyed by (markup, style name)
+_PARSED_FRAGS: dict[tuple[str, str], list] = {}
+
+
+def _esc(text: str) -> str:
+    """Escape &, < and > for ReportLab paragraph markup."""
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
 
 class NewsletterPDF:
     """PDF newsletter generator with professional formatting."""
 
-    def __init__(self, output_path: Path, mode: str = "daily"):
+    def __init__(
+        self,
+        output_path: Union[Path, BinaryIO],
+        mode: str = "daily",
+        render_time: Optional[datetime] = None
+    ):
         self.output_path = output_path
         self.mode = mode
+        self.render_time = render_time or datetime.now()
         self.doc = SimpleDocTemplate(
-            str(output_path),
+            output_path if hasattr(output_path, "write") else str(output_path),
             pagesize=letter,
             rightMargin=0.75 * inch,
             leftMargin=0.75 * inch,
@@ -70,8 +104,10 @@ class NewsletterPDF:
         self.story = []
         self.styles = self._create_styles()
 
-    def _create_styles(self) -> dict:
-        """Create custom paragraph styles."""
+    @staticmethod
+    @cache
+    def _create_styles() -> StyleSheet1:
+        """Create custom paragraph styles (built once, shared read-only by all instances)."""
         styles = getSampleStyleSheet()
 
         styles.add(ParagraphStyle(
@@ -168,6 +204,13 @@ class NewsletterPDF:
             leading=14
         ))
 
+        # Bullet list item carrying its own gap, in place of a trailing Spacer
+        styles.add(ParagraphStyle(
+            name='BulletPointSpaced',
+            parent=styles['BulletPoint'],
+            spaceAfter=8
+        ))
+
         styles.add(ParagraphStyle(
             name='TOCEntry',
             parent=styles['Normal'],
@@ -186,6 +229,26 @@ class NewsletterPDF:
             spaceAfter=2
         ))
 
+        # Story and chain paragraphs that carry the gaps Spacers used to add
+        styles.add(ParagraphStyle(
+            name='StoryMeta',
+            parent=styles['Source'],
+            spaceAfter=8
+        ))
+
+        styles.add(ParagraphStyle(
+            name='StoryBody',
+            parent=styles['CustomBody'],
+            spaceAfter=9
+        ))
+
+        styles.add(ParagraphStyle(
+            name='ChainSignificance',
+            parent=styles['CustomBody'],
+            spaceBefore=4,
+            spaceAfter=17
+        ))
+
         styles.add(ParagraphStyle(
             name='FooterText',
             parent=styles['Normal'],
@@ -198,19 +261,16 @@ class NewsletterPDF:
         return styles
 
     def _get_date_range(self) -> str:
-        end_date = datetime.now()
-        if self.mode == "weekly":
-            start_date = end_date - timedelta(days=10)
-            return f"{start_date.strftime('%b %d')} - {end_date.strftime('%b %d, %Y')}"
-        else:
-            return end_date.strftime("%B %d, %Y")
+        return get_date_range(self.mode, self.render_time)
 
     def _add_section_divider(self):
         """Add a horizontal rule divider."""
+        # Fresh flowables each time: Platypus marks a flowable that didn't fit
+        # as postponed and never clears it, so instances can't be shared
         self.story.append(Spacer(1, 0.1 * inch))
         self.story.append(HRFlowable(
             width="100%", thickness=1,
-            color=colors.HexColor('#e0e0e0'),
+            color=DIVIDER_COLOR,
             spaceAfter=8, spaceBefore=8
         ))
 
@@ -236,15 +296,16 @@ class NewsletterPDF:
         self.story.append(Paragraph("IN THIS ISSUE", self.styles['SectionHeader']))
 
         for i, story in enumerate(top_stories[:5], 1):
-            if story.summary:
-                headline = story.summary.headline
-                category = story.summary.category
+            summary = story.summary
+            if summary:
+                headline = summary.headline
+                category = summary.category
             else:
                 headline = story.news_item.title
                 category = "News"
 
             cat_label = CATEGORY_LABELS.get(category, "[NEWS]")
-            toc_entry = f"<b>{i}.</b> {headline} <font color='#3498db'>{cat_label}</font>"
+            toc_entry = f"<b>{i}.</b> {_esc(headline)} <font color='#3498db'>{cat_label}</font>"
             self.story.append(Paragraph(toc_entry, self.styles['TOCEntry']))
 
         self._add_section_divider()
@@ -252,69 +313,66 @@ class NewsletterPDF:
     def add_main_story(self, story: RankedStory, story_number: int):
         """Add a main story card with full details."""
         item = story.news_item
+        summary = story.summary
+        source_name = item.source_name
 
         # Use summary if available, fall back to raw data
-        if story.summary:
-            headline = story.summary.headline
-            category = story.summary.category
-            hook = story.summary.hook
-            details = story.summary.details
-            why_matters = story.summary.why_it_matters
-            credit = story.summary.image_suggestion.credit_line
+        if summary:
+            headline = summary.headline
+            category = summary.category
+            hook = summary.hook
+            details = summary.details
+            why_matters = summary.why_it_matters
+            credit = summary.image_suggestion.credit_line
         else:
             headline = item.title
             category = "News"
             hook = item.summary_raw or item.content_snippet[:200]
             details = [item.content_snippet[:200]] if item.content_snippet else ["Details pending."]
-            why_matters = f"A developing story from {item.source_name}."
-            credit = f"Source: {item.source_name}"
+            why_matters = f"A developing story from {source_name}."
+            credit = f"Source: {source_name}"
 
-        cat_label = CATEGORY_LABELS.get(category, "[NEWS]")
-        cat_color = CATEGORY_COLORS.get(category, colors.HexColor('#333333'))
+        markup = CATEGORY_MARKUP.get(category)
+        if markup is None:
+            markup = (
+                "[NEWS]",
+                f"<font color='{DEFAULT_CATEGORY_COLOR}'><b>{_esc(category)}</b></font>"
+            )
+        cat_label, cat_tag = markup
 
         story_elements = []
 
         # Story number + headline
-        headline_text = f"<b>{story_number}. {cat_label} {headline}</b>"
+        headline_text = f"<b>{story_number}. {cat_label} {_esc(headline)}</b>"
         story_elements.append(Paragraph(headline_text, self.styles['StoryHeadline']))
 
         # Category and source line
-        meta_line = f"<font color='{cat_color}'><b>{category}</b></font> | {item.source_name}"
-        story_elements.append(Paragraph(meta_line, self.styles['Source']))
-        story_elements.append(Spacer(1, 0.08 * inch))
-
-        # Hook
-        story_elements.append(Paragraph(hook, self.styles['CustomBody']))
-        story_elements.append(Spacer(1, 0.08 * inch))
-
-        # Details
-        story_elements.append(Paragraph("<b>The details:</b>", self.styles['CustomBody']))
-        for detail in details:
-            # Escape XML special chars for reportlab
-            safe_detail = detail.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-            story_elements.append(Paragraph(f"\u2022 {safe_detail}", self.styles['BulletPoint']))
+        meta_line = f"{cat_tag} | {_esc(source_name)}"
+        story_elements.append(Paragraph(meta_line, self.styles['StoryMeta']))
 
-        story_elements.append(Spacer(1, 0.08 * inch))
-
-        # Why it matters
-        safe_why = why_matters.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-        story_elements.append(Paragraph(f"<b>Why it matters:</b> {safe_why}", self.styles['CustomBody']))
+        # Hook, details and why it matters as a single body paragraph
+        safe_details = "".join(
+            f"<br/>\u2022 {_esc(detail)}" for detail in details
+        )
+        body = (
+            f"{_esc(hook)}<br/><br/><b>The details:</b>{safe_details}"
+            f"<br/><br/><b>Why it matters:</b> {_esc(why_matters)}"
+        )
+        story_elements.append(Paragraph(body, self.styles['StoryBody']))
 
         # Read more link
-        source_text = f"<link href='{item.url}' color='blue'>Read more at {item.source_name}</link>"
-        story_elements.append(Spacer(1, 0.04 * inch))
+        source_text = f"<link href='{item.url}' color='blue'>Read more at {_esc(source_name)}</link>"
         story_elements.append(Paragraph(source_text, self.styles['Source']))
 
         # Add all story elements directly (no KeepTogether+Table nesting
         # which can overflow when content is tall)
-        for el in story_elements:
-            self.story.append(el)
+        self.story.extend(story_elements)
 
         # Visual divider between stories
         self.story.append(Spacer(1, 0.08 * inch))
         self.story.append(HRFlowable(
             width="100%", thickness=0.5,
-            color=colors.HexColor('#e0e0e0'),
+            color=DIVIDER_COLOR,
             spaceAfter=8, spaceBefore=4
         ))
         self.story.append(Spacer(1, 0.08 * inch))
@@ -335,29 +393,43 @@ class NewsletterPDF:
             if len(stories) < 2:
                 continue
 
-            sorted_stories = sorted(stories, key=lambda s: s.news_item.published_at)
+            sorted_stories = sorted(stories, key=STORY_DATE_KEY)
 
             first = sorted_stories[0]
             chain_title = first.summary.headline if first.summary else first.news_item.title
-            self.story.append(Paragraph(f"<b>{chain_title}</b>", self.styles['StoryHeadline']))
+            self.story.append(Paragraph(f"<b>{_esc(chain_title)}</b>", self.styles['StoryHeadline']))
 
             for story in sorted_stories:
-                date_str = story.news_item.published_at.strftime("%b %d")
-                headline = story.summary.headline if story.summary else story.news_item.title
-                source = story.news_item.source_name
-
-                safe_headline = headline.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-                entry = f"\u2022 <b>{date_str}:</b> {safe_headline} <i>({source})</i>"
+                item = story.news_item
+                summary = story.summary
+                date_str = format_short_date(item.published_at)
+                headline = summary.headline if summary else item.title
+                source = item.source_name
+
+                safe_headline = _esc(headline)
+                entry = f"\u2022 <b>{date_str}:</b> {safe_headline} <i>({_esc(source)})</i>"
                 self.story.append(Paragraph(entry, self.styles['BulletPoint']))
 
             # Add significance from latest story
             latest = sorted_stories[-1]
             if latest.summary:
-                safe_sig = latest.summary.why_it_matters.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-                self.story.append(Spacer(1, 0.05 * inch))
-                self.story.append(Paragraph(f"<i>What it means: {safe_sig}</i>", self.styles['CustomBody']))
+                safe_sig = _esc(latest.summary.why_it_matters)
+                self.story.append(Paragraph(
+                    f"<i>What it means: {safe_sig}</i>", self.styles['ChainSignificance']
+                ))
+            else:
+                self.story.append(Spacer(1, 0.15 * inch))
 
-            self.story.append(Spacer(1, 0.15 * inch))
+    def _constant_paragraph(self, markup: str, style_name: str) -> Paragraph:
+        """Build a Paragraph for constant markup, parsing it once per process."""
+        style = self.styles[style_name]
+        frags = _PARSED_FRAGS.get((markup, style_name))
+        if frags is None:
+            paragraph = Paragraph(markup, style)
+            _PARSED_FRAGS[markup, style_name] = paragraph.frags
+            return paragraph
+
+        return Paragraph(markup, style, frags=frags)
 
     def add_quick_bites(self, secondary_stories: List[RankedStory]):
         """Section 4: Quick bites."""
@@ -367,21 +439,25 @@ class NewsletterPDF:
         self.story.append(PageBreak())
         self.story.append(Paragraph("QUICK BITES", self.styles['SectionHeader']))
 
+        # All quick bites share one paragraph, separated by blank lines
+        quick_bites = []
         for story in secondary_stories:
             item = story.news_item
+            summary = story.summary
 
-            if story.summary:
-                headline = story.summary.headline
-                snippet = story.summary.hook[:150]
+            if summary:
+                headline = summary.headline
+                snippet = summary.hook[:150]
             else:
                 headline = item.title
                 snippet = item.content_snippet[:150]
 
-            safe_headline = headline.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-            safe_snippet = snippet.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-            quick_bite = f"\u2022 <b>{safe_headline}</b> \u2014 {safe_snippet} <i>({item.source_name})</i>"
-            self.story.append(Paragraph(quick_bite, self.styles['BulletPoint']))
-            self.story.append(Spacer(1, 0.06 * inch))
+            quick_bites.append(
+                f"\u2022 <b>{_esc(headline)}</b> \u2014 {_esc(snippet)} "
+                f"<i>({_esc(item.source_name)})</i>"
+            )
+
+        self.story.append(Paragraph("<br/><br/>".join(quick_bites), self.styles['BulletPointSpaced']))
 
     def add_top_jobs(self):
         """Section 6: Top AI jobs."""
@@ -389,18 +465,9 @@ class NewsletterPDF:
         self._add_section_divider()
         self.story.append(Paragraph("TOP AI JOBS THIS WEEK", self.styles['SectionHeader']))
 
-        jobs = [
-            ("Senior ML Engineer", "OpenAI", "San Francisco, CA", "Build next-gen language models"),
-            ("AI Research Scientist", "Google DeepMind", "London, UK", "Advance AGI research"),
-            ("Applied AI Lead", "Anthropic", "Remote", "Lead safety research initiatives"),
-            ("Computer Vision Engineer", "Tesla", "Palo Alto, CA", "Autonomous driving AI"),
-            ("NLP Engineer", "Meta", "Menlo Park, CA", "Large-scale NLP systems"),
-        ]
-
-        for title, company, location, description in jobs:
+        for title, company, location, description in PLACEHOLDER_JOBS:
             job_text = f"\u2022 <b>{title}</b> at {company} \u2014 {location} \u2014 {description}"
-            self.story.append(Paragraph(job_text, self.styles['BulletPoint']))
-            self.story.append(Spacer(1, 0.05 * inch))
+            self.story.append(self._constant_paragraph(job_text, 'BulletPointSpaced'))
 
     def add_trending_tools(self):
         """Section 7: Trending AI tools."""
@@ -408,35 +475,17 @@ class NewsletterPDF:
         self._add_section_divider()
         self.story.append(Paragraph("TRENDING AI TOOLS", self.styles['SectionHeader']))
 
-        tools = [
-            ("Claude Code", "AI-powered coding assistant for the terminal"),
-            ("Midjourney v6", "State-of-the-art text-to-image generation"),
-            ("LangChain", "Framework for building LLM applications"),
-            ("Replicate", "Run and deploy ML models via API"),
-            ("Weights &amp; Biases", "ML experiment tracking and visualization"),
-        ]
-
-        for tool_name, description in tools:
-            tool_text = f"\u2022 <b>{tool_name}</b> \u2014 {description}"
-            self.story.append(Paragraph(tool_text, self.styles['BulletPoint']))
-            self.story.append(Spacer(1, 0.05 * inch))
+        for tool_name, description, _url in PLACEHOLDER_TOOLS:
+            tool_text = f"\u2022 <b>{_esc(tool_name)}</b> \u2014 {description}"
+            self.story.append(self._constant_paragraph(tool_text, 'BulletPointSpaced'))
 
     def add_sources(self, all_stories: List[RankedStory]):
         """Section 8: Sources."""
         self.story.append(PageBreak())
         self.story.append(Paragraph("SOURCES", self.styles['SectionHeader']))
 
-        sources = []
-        seen_urls = set()
-
-        for story in all_stories:
-            item = story.news_item
-            if item.url not in seen_urls:
-                sources.append((item.source_name, item.url))
-                seen_urls.add(item.url)
-
         source_data = []
-        for i, (source_name, url) in enumerate(sources, 1):
+        for i, (source_name, url) in enumerate(unique_sources(all_stories), 1):
             display_url = url if len(url) < 70 else url[:67] + "..."
             source_data.append([f"{i}.", source_name, display_url])
 
@@ -493,9 +542,10 @@ def export_to_pdf(
     top_stories: List[RankedStory],
     secondary_stories: List[RankedStory],
     intro: str,
-    output_path: Path,
+    output_path: Union[Path, BinaryIO],
     mode: str = "daily",
-    story_chains: Optional[dict] = None
+    story_chains: Optional[dict] = None,
+    render_time: Optional[datetime] = None
 ) -> None:
     """
     Export newsletter to PDF with all 9 sections.
@@ -504,13 +554,14 @@ def export_to_pdf(
         top_stories: List of main stories
         secondary_stories: List of secondary stories
         intro: Newsletter introduction
-        output_path: Path to save PDF
+        output_path: Path to save PDF, or a binary file object to write it to
         mode: "daily" or "weekly"
         story_chains: Optional dict of story chains for developing stories
+        render_time: Issue date for the header (defaults to the current time)
     """
     logger.info(f"Exporting newsletter to PDF: {output_path}")
 
-    pdf = NewsletterPDF(output_path, mode)
+    pdf = NewsletterPDF(output_path, mode, render_time)
 
     # Section 1: Header
     pdf.add_header(intro)
@@ -547,3 +598,38 @@ def export_to_pdf(
     pdf.build()
 
     logger.info(f"PDF export complete: {output_path}")
+
+
+def export_to_pdf_bytes(
+    top_stories: List[RankedStory],
+    secondary_stories: List[RankedStory],
+    intro: str,
+    mode: str = "daily",
+    story_chains: Optional[dict] = None,
+    render_time: Optional[datetime] = None
+) -> bytes:
+    """
+    Export newsletter to an in-memory PDF, without touching the filesystem.
+
+    Args:
+        top_stories: List of main stories
+        secondary_stories: List of secondary stories
+        intro: Newsletter introduction
+        mode: "daily" or "weekly"
+        story_chains: Optional dict of story chains for developing stories
+        render_time: Issue date for the header (defaults to the current time)
+
+    Returns:
+        PDF file contents
+    """
+    buffer = BytesIO()
+    export_to_pdf(
+        top_stories,
+        secondary_stories,
+        intro,
+        buffer,
+        mode,
+        story_chains,
+        render_time=render_time
+    )
+    return buffer.getvalue()
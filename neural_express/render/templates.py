@@ -1,6 +1,13 @@
 """Markdown templates for newsletter generation."""
 
 from datetime import datetime, timedelta
+from functools import lru_cache
+import keyword
+from operator import attrgetter
+from string import Formatter
+from typing import Callable, Optional
+
+from ..utils.schema import RankedStory
 
 
 NEWSLETTER_HEADER = """# NEURAL EXPRESS WEEKLY
@@ -116,6 +123,56 @@ Thanks for reading Neural Express! {wave}
 """
 
 
+def compile_template(template: str) -> Callable[..., str]:
+    """
+    Compile a template into a keyword-only function that renders it.
+
+    The template is parsed once and turned into a single join of its
+    literal text and str() of each field, so rendering skips str.format's
+    per-call parsing. Only plain {field} placeholders are supported.
+
+    Args:
+        template: Template string in str.format syntax
+
+    Returns:
+        Function taking the template's fields as keyword arguments
+
+    Raises:
+        ValueError: If a placeholder uses a conversion or format spec, or
+            isn't usable as a keyword argument
+    """
+    parsed = []
+    fields = []
+
+    for literal, field, spec, conversion in Formatter().parse(template):
+        if field is not None and (
+            spec or conversion or not field.isidentifier() or keyword.iskeyword(field)
+        ):
+            raise ValueError(f"Unsupported template placeholder: {{{field}}}")
+        parsed.append((literal, field))
+        if field is not None and field not in fields:
+            fields.append(field)
+
+    # Bind str under a private name no field can shadow
+    converter = "_str"
+    while converter in fields:
+        converter = f"_{converter}"
+
+    pieces = []
+    for literal, field in parsed:
+        if literal:
+            pieces.append(repr(literal))
+        if field is not None:
+            pieces.append(f"{converter}({field})")
+
+    params = f"*, {', '.join(fields)}" if fields else ""
+    source = f"def render({params}):\n    return ''.join(({', '.join(pieces)},))\n"
+
+    namespace: dict = {converter: str}
+    exec(source, namespace)
+    return namespace["render"]
+
+
 CATEGORY_EMOJIS = {
     "Chips": "\U0001f4bb",
     "Hardware": "\U0001f4bb",
@@ -135,9 +192,14 @@ def get_category_emoji(category: str) -> str:
     return CATEGORY_EMOJIS.get(category, "\U0001f4f0")
 
 
-def get_date_range(mode: str = "weekly") -> str:
-    """Get formatted date range string."""
-    end_date = datetime.now()
+def get_date_range(mode: str = "weekly", now: Optional[datetime] = None) -> str:
+    """Get formatted date range string ending at now (defaults to the current time)."""
+    return _format_date_range(mode, now or datetime.now())
+
+
+@lru_cache(maxsize=8)
+def _format_date_range(mode: str, end_date: datetime) -> str:
+    """Format the date range ending at end_date (cached per render time)."""
     if mode == "weekly":
         start_date = end_date - timedelta(days=10)
         return f"{start_date.strftime('%b %d')} - {end_date.strftime('%b %d, %Y')}"
@@ -145,6 +207,22 @@ def get_date_range(mode: str = "weekly") -> str:
         return end_date.strftime("%B %d, %Y")
 
 
+# Sort key for ordering stories chronologically
+STORY_DATE_KEY = attrgetter("news_item.published_at")
+
+
+# English month abbreviations, as strftime("%b") gives in the C locale
+MONTH_ABBREVIATIONS = (
+    "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+    "Jul", "Aug", "Sep", "Oct", "Nov", "Dec",
+)
+
+
+def format_short_date(date: datetime) -> str:
+    """Format a date as "Mon DD" (like strftime("%b %d"), without the C call)."""
+    return f"{MONTH_ABBREVIATIONS[date.month - 1]} {date.day:02d}"
+
+
 def format_toc_item(headline: str, number: int, category: str) -> str:
     """Format table of contents item with number and category."""
     emoji = get_category_emoji(category)
@@ -161,8 +239,37 @@ def format_source_list(sources: list[tuple[str, str]]) -> str:
     Returns:
         Formatted markdown list
     """
-    items = [f"{i}. [{name}]({url})" for i, (name, url) in enumerate(sources, 1)]
-    return "\n".join(items)
+    return "\n".join(format_source_items(sources))
+
+
+def unique_sources(stories: list[RankedStory]) -> list[tuple[str, str]]:
+    """
+    Collect story sources, one per URL, in first-seen order.
+
+    Args:
+        stories: Stories to cite
+
+    Returns:
+        List of (name, url) tuples
+    """
+    sources: dict[str, str] = {}
+    for story in stories:
+        sources.setdefault(story.news_item.url, story.news_item.source_name)
+
+    return [(name, url) for url, name in sources.items()]
+
+
+def format_source_items(sources: list[tuple[str, str]]) -> list[str]:
+    """
+    Format sources as numbered markdown lines.
+
+    Args:
+        sources: List of (name, url) tuples
+
+    Returns:
+        List of formatted lines
+    """
+    return [f"{i}. [{name}]({url})" for i, (name, url) in enumerate(sources, 1)]
 
 
 def format_details_list(details: list[str]) -> str:
@@ -175,8 +282,10 @@ def format_details_list(details: list[str]) -> str:
     Returns:
         Formatted markdown list
     """
-    items = [f"- {detail}" for detail in details]
-    return "\n".join(items)
+    if not details:
+        return ""
+
+    return "- " + "\n- ".join(details)
 
 
 # Placeholder data for jobs and tools sections
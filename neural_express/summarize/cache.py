@@ -0,0 +1,121 @@
+"""Persistent on-disk cache for LLM completions."""
+
+import hashlib
+import json
+import os
+import pickle
+import time
+from pathlib import Path
+from typing import Optional
+
+from ..utils.logging import get_logger
+from ..utils.io import ensure_dir
+
+logger = get_logger("summarize.cache")
+
+
+class CompletionCache:
+    """Completion cache keyed by a hash of the full request, persisted as a pickle."""
+
+    def __init__(self, filepath: Path, ttl_seconds: float = 7 * 24 * 3600):
+        """
+        Initialize cache and load any unexpired entries.
+
+        Args:
+            filepath: Path to the pickle cache file
+            ttl_seconds: How long a cached completion stays valid
+        """
+        self.filepath = filepath
+        self.ttl_seconds = ttl_seconds
+        self.entries: dict[str, tuple[float, str]] = {}
+        self._dirty = False
+        self._load()
+
+    @staticmethod
+    def make_key(request: dict) -> str:
+        """
+        Build a cache key from chat completion request arguments.
+
+        Args:
+            request: Request arguments (model, messages, sampling settings)
+
+        Returns:
+            Hex digest identifying the request
+        """
+        payload = json.dumps(request, sort_keys=True, ensure_ascii=False)
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+    def _load(self) -> None:
+        """Load cached completions from disk, dropping expired ones."""
+        if not self.filepath.exists():
+            return
+
+        try:
+            with open(self.filepath, "rb") as f:
+                entries = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Failed to load completion cache {self.filepath}: {e}")
+            return
+
+        cutoff = time.time() - self.ttl_seconds
+        self.entries = {
+            key: entry for key, entry in entries.items() if entry[0] >= cutoff
+        }
+        self._dirty = len(self.entries) != len(entries)
+
+        logger.info(f"Loaded {len(self.entries)} cached completions from {self.filepath}")
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Get a cached completion.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Completion text, or None if missing or expired
+        """
+        entry = self.entries.get(key)
+        if entry is None or entry[0] < time.time() - self.ttl_seconds:
+            return None
+
+        return entry[1]
+
+    def set(self, key: str, content: str) -> None:
+        """
+        Store a completion.
+
+        Args:
+            key: Cache key from make_key
+            content: Completion text
+        """
+        self.entries[key] = (time.time(), content)
+        self._dirty = True
+
+    def discard(self, key: str) -> None:
+        """
+        Remove a completion if present.
+
+        Args:
+            key: Cache key from make_key
+        """
+        if self.entries.pop(key, None) is not None:
+            self._dirty = True
+
+    def save(self) -> None:
+        """Atomically write the cache to disk if it changed."""
+        if not self._dirty:
+            return
+
+        ensure_dir(self.filepath.parent)
+        tmp_path = self.filepath.with_suffix(f".tmp{os.getpid()}")
+
+        with open(tmp_path, "wb") as f:
+            pickle.dump(self.entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.filepath)
+        self._dirty = False
+
+        logger.debug(f"Saved {len(self.entries)} completions to {self.filepath}")
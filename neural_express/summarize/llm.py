@@ -1,14 +1,56 @@
 """OpenAI LLM client wrapper."""
 
+import asyncio
 import json
+import logging
+from functools import lru_cache
 from typing import Optional
-from openai import OpenAI, OpenAIError
+from openai import AsyncOpenAI, DefaultHttpxClient, OpenAI, OpenAIError
 
 from ..utils.logging import get_logger
+from .cache import CompletionCache
+
+# Prefer orjson's faster parser when it's installed (its errors subclass JSONDecodeError)
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 logger = get_logger("summarize.llm")
 
 
+@lru_cache(maxsize=4)
+def _shared_client(api_key: str, max_retries: int) -> OpenAI:
+    """
+    Get the sync OpenAI client for an API key, shared by every LLMClient.
+
+    Reusing one client keeps its keep-alive connection pool (and TLS
+    sessions) across instances. The async client isn't shared this way
+    because its connections belong to the event loop that opened them.
+
+    Args:
+        api_key: OpenAI API key
+        max_retries: Retries for rate-limited / failed requests
+
+    Returns:
+        OpenAI client using an HTTP/2 connection pool
+    """
+    return OpenAI(
+        api_key=api_key,
+        max_retries=max_retries,
+        http_client=DefaultHttpxClient(http2=True)
+    )
+
+
+def _is_json(text: str) -> bool:
+    """Check whether text parses as JSON."""
+    try:
+        _json_loads(text)
+    except json.JSONDecodeError:
+        return False
+    return True
+
+
 class LLMClient:
     """Wrapper for OpenAI API."""
 
@@ -17,7 +59,9 @@ class LLMClient:
         api_key: str,
         model: str = "gpt-4o-mini",
         temperature: float = 0.7,
-        max_tokens: int = 1000
+        max_tokens: int = 1000,
+        cache: Optional[CompletionCache] = None,
+        max_retries: int = 2
     ):
         """
         Initialize LLM client.
@@ -27,14 +71,41 @@ class LLMClient:
             model: Model name
             temperature: Sampling temperature
             max_tokens: Maximum tokens in response
+            cache: Optional on-disk cache of completions for repeated requests
+            max_retries: Retries on connection errors, 429s and 5xx responses
+                (the SDK backs off exponentially and honors Retry-After)
         """
-        self.client = OpenAI(api_key=api_key)
+        self.client = _shared_client(api_key, max_retries)
+        self.api_key = api_key
+        self.max_retries = max_retries
+        self._async_client: Optional[AsyncOpenAI] = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
         self.model = model
         self.temperature = temperature
         self.max_tokens = max_tokens
+        self.cache = cache
 
         logger.info(f"Initialized OpenAI client with model {model}")
 
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """
+        Get the async client for the running event loop.
+
+        Its pooled connections belong to the loop that opened them, so a
+        new client is created whenever the loop changes (e.g. each run's
+        asyncio.run) instead of reusing one across loops.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            self._async_client = self._create_async_client()
+            self._async_loop = loop
+        return self._async_client
+
+    def _create_async_client(self) -> AsyncOpenAI:
+        """Create a new async OpenAI client."""
+        return AsyncOpenAI(api_key=self.api_key, max_retries=self.max_retries)
+
     def generate(
         self,
         prompt: str,
@@ -55,6 +126,59 @@ class LLMClient:
         Raises:
             OpenAIError: If API call fails
         """
+        request = self._completion_kwargs(prompt, system_prompt, json_mode)
+        cached = self._cached_content(request)
+        if cached is not None:
+            return cached
+
+        try:
+            response = self.client.chat.completions.create(**request)
+            return self._store_content(request, response)
+
+        except OpenAIError as e:
+            logger.error(f"OpenAI API error: {e}")
+            raise
+
+    async def agenerate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        json_mode: bool = False
+    ) -> str:
+        """
+        Generate completion from prompt without blocking the event loop.
+
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
+            json_mode: If True, enforce JSON response format
+
+        Returns:
+            Generated text
+
+        Raises:
+            OpenAIError: If API call fails
+        """
+        request = self._completion_kwargs(prompt, system_prompt, json_mode)
+        cached = self._cached_content(request)
+        if cached is not None:
+            return cached
+
+        try:
+            response = await self.async_client.chat.completions.create(**request)
+            return self._store_content(request, response)
+
+        except OpenAIError as e:
+            logger.error(f"OpenAI API error: {e}")
+            raise
+
+    def _completion_kwargs(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        json_mode: bool
+    ) -> dict:
+        """Build chat completion request arguments."""
         messages = []
 
         if system_prompt:
@@ -62,29 +186,43 @@ class LLMClient:
 
         messages.append({"role": "user", "content": prompt})
 
-        try:
-            response_format = {"type": "json_object"} if json_mode else {"type": "text"}
-
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-                response_format=response_format
-            )
+        response_format = {"type": "json_object"} if json_mode else {"type": "text"}
+
+        return {
+            "model": self.model,
+            "messages": messages,
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
+            "response_format": response_format
+        }
 
-            content = response.choices[0].message.content
+    def _cached_content(self, request: dict) -> Optional[str]:
+        """Look up a completion for this exact request in the cache."""
+        if self.cache is None:
+            return None
 
+        content = self.cache.get(CompletionCache.make_key(request))
+        if content is not None and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Completion cache hit ({len(content)} chars)")
+
+        return content
+
+    def _store_content(self, request: dict, response) -> str:
+        """Extract generated text from a response and cache it."""
+        content = response.choices[0].message.content
+
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(
                 f"Generated {len(content)} chars "
                 f"(tokens: {response.usage.total_tokens})"
             )
 
-            return content
+        # Malformed JSON-mode output isn't cached, so a rerun can still fix it
+        json_mode = request["response_format"]["type"] == "json_object"
+        if self.cache is not None and (not json_mode or _is_json(content)):
+            self.cache.set(CompletionCache.make_key(request), content)
 
-        except OpenAIError as e:
-            logger.error(f"OpenAI API error: {e}")
-            raise
+        return content
 
     def generate_json(
         self,
@@ -111,8 +249,40 @@ class LLMClient:
             json_mode=True
         )
 
+        return self._parse_json(response)
+
+    async def agenerate_json(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None
+    ) -> dict:
+        """
+        Generate JSON response from prompt without blocking the event loop.
+
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
+
+        Returns:
+            Parsed JSON dict
+
+        Raises:
+            OpenAIError: If API call fails
+            json.JSONDecodeError: If response is not valid JSON
+        """
+        response = await self.agenerate(
+            prompt,
+            system_prompt=system_prompt,
+            json_mode=True
+        )
+
+        return self._parse_json(response)
+
+    @staticmethod
+    def _parse_json(response: str) -> dict:
+        """Parse a JSON-mode response, logging the content on failure."""
         try:
-            return json.loads(response)
+            return _json_loads(response)
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON response: {e}")
             logger.debug(f"Response content: {response}")
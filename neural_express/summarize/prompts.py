@@ -1,15 +1,11 @@
 """LLM prompt templates for summarization."""
 
-STORY_SUMMARY_PROMPT = """You are an AI news editor creating concise, engaging summaries for a tech newsletter about artificial intelligence.
+# Static instructions go in the system message, ahead of any per-story
+# text, so every request shares a byte-identical prefix that the provider
+# can cache.
+STORY_SUMMARY_SYSTEM_PROMPT = """You are an AI news editor creating concise, engaging summaries for a tech newsletter about artificial intelligence.
 
-Given the following news article, create a structured summary suitable for a newsletter.
-
-ARTICLE:
-Title: {title}
-Source: {source_name}
-URL: {url}
-Published: {published_at}
-Content: {content}
+Given a news article, create a structured summary suitable for a newsletter.
 
 INSTRUCTIONS:
 1. Create a catchy, informative headline (under 70 characters)
@@ -20,29 +16,34 @@ INSTRUCTIONS:
 6. Suggest image keywords and credit line
 
 Respond in JSON format:
-{{
+{
   "headline": "string",
   "hook": "string",
   "details": ["string", "string", ...],
   "why_it_matters": "string",
   "category": "string",
-  "image_suggestion": {{
+  "image_suggestion": {
     "search_keywords": ["string", ...],
     "credit_line": "string",
     "source_url": null,
     "fallback_banner": false
-  }}
-}}
+  }
+}
 
 Focus on accuracy, clarity, and reader engagement. Maintain a professional but accessible tone."""
 
 
-NEWSLETTER_INTRO_PROMPT = """You are an AI news editor writing the introduction for today's AI newsletter.
+STORY_SUMMARY_PROMPT = """ARTICLE:
+Title: {title}
+Source: {source_name}
+URL: {url}
+Published: {published_at}
+Content: {content}"""
+
 
-Here are the top {count} stories we're covering:
-{story_summaries}
+NEWSLETTER_INTRO_SYSTEM_PROMPT = """You are an AI news editor writing the introduction for today's AI newsletter.
 
-Write a brief, engaging introduction (2-3 sentences) that:
+Given the top stories being covered, write a brief, engaging introduction (2-3 sentences) that:
 1. Greets the reader warmly
 2. Previews the key themes or highlights
 3. Sets an informative but conversational tone
@@ -51,6 +52,11 @@ Keep it under 50 words. Start with "Good morning, Reader 👋"
 """
 
 
+NEWSLETTER_INTRO_PROMPT = """Here are the top {count} stories we're covering:
+{story_summaries}
+"""
+
+
 def get_story_summary_prompt(
     title: str,
     source_name: str,
@@ -66,7 +72,7 @@ def get_story_summary_prompt(
         source_name: Source name
         url: Article URL
         published_at: Publication date
-        content: Article content
+        content: Article content snippet (already capped at ingestion)
 
     Returns:
         Formatted prompt string
@@ -76,7 +82,7 @@ def get_story_summary_prompt(
         source_name=source_name,
         url=url,
         published_at=published_at,
-        content=content[:2000]  # Limit content length
+        content=content
     )
 
 
@@ -92,10 +98,11 @@ def get_newsletter_intro_prompt(
     Returns:
         Formatted prompt string
     """
-    summaries_text = "\n".join(
-        f"{i+1}. {summary}"
-        for i, summary in enumerate(story_summaries)
-    )
+    # join() builds a list from its argument anyway; pass one directly
+    summaries_text = "\n".join([
+        f"{i}. {summary}"
+        for i, summary in enumerate(story_summaries, 1)
+    ])
 
     return NEWSLETTER_INTRO_PROMPT.format(
         count=len(story_summaries),
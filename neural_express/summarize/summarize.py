@@ -1,13 +1,34 @@
 """Story summarization pipeline."""
 
-from typing import Optional
+import asyncio
+import json
+from typing import Final, Optional
 from ..utils.schema import RankedStory, StorySummary, ImageSuggestion
 from ..utils.logging import get_logger
 from .llm import LLMClient
-from .prompts import get_story_summary_prompt
+from .cache import CompletionCache
+from .prompts import get_story_summary_prompt, STORY_SUMMARY_SYSTEM_PROMPT
+
+# Prefer orjson's faster parser for cached summaries when it's installed
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 logger = get_logger("summarize")
 
+# Fallback summary category for each (lowercase) item tag
+_TAG_CATEGORY: Final[dict[str, str]] = {
+    "chips": "Chips", "hardware": "Chips", "gpu": "Chips",
+    "research": "Research", "paper": "Research", "study": "Research",
+    "policy": "Policy", "regulation": "Policy", "law": "Policy",
+    "tools": "Tools", "developer-tools": "Tools", "framework": "Tools",
+    "funding": "Funding", "investment": "Funding", "startup": "Funding",
+    "agents": "Tools", "llm": "Research", "open-source": "Tools",
+    "robotics": "Robotics", "robot": "Robotics",
+    "safety": "AGI/Safety", "alignment": "AGI/Safety",
+}
+
 
 def _create_fallback_summary(story: RankedStory) -> StorySummary:
     """
@@ -21,22 +42,15 @@ def _create_fallback_summary(story: RankedStory) -> StorySummary:
     """
     item = story.news_item
 
-    # Derive category from tags
-    tag_category_map = {
-        "chips": "Chips", "hardware": "Chips", "gpu": "Chips",
-        "research": "Research", "paper": "Research", "study": "Research",
-        "policy": "Policy", "regulation": "Policy", "law": "Policy",
-        "tools": "Tools", "developer-tools": "Tools", "framework": "Tools",
-        "funding": "Funding", "investment": "Funding", "startup": "Funding",
-        "agents": "Tools", "llm": "Research", "open-source": "Tools",
-        "robotics": "Robotics", "robot": "Robotics",
-        "safety": "AGI/Safety", "alignment": "AGI/Safety",
-    }
-    category = "Business"
-    for tag in item.tags:
-        if tag.lower() in tag_category_map:
-            category = tag_category_map[tag.lower()]
-            break
+    # Derive category from the first tag that maps to one
+    category = next(
+        (
+            _TAG_CATEGORY[tag]
+            for tag in map(str.lower, item.tags)
+            if tag in _TAG_CATEGORY
+        ),
+        "Business"
+    )
 
     # Build details from content snippet
     snippet = item.content_snippet or item.summary_raw or ""
@@ -58,9 +72,65 @@ def _create_fallback_summary(story: RankedStory) -> StorySummary:
     )
 
 
-def summarize_story(
+def _summary_cache_keys(story: RankedStory) -> tuple[str, str]:
+    """
+    Build summary cache keys for a story.
+
+    Args:
+        story: Ranked story
+
+    Returns:
+        Tuple of (key for this URL and content, key for this URL alone)
+    """
+    item = story.news_item
+    return (
+        CompletionCache.make_key({"url": item.url, "content": item.content_snippet}),
+        CompletionCache.make_key({"url": item.url})
+    )
+
+
+def _cached_summary(
     story: RankedStory,
-    llm_client: LLMClient
+    cache: CompletionCache
+) -> Optional[StorySummary]:
+    """
+    Look up a previously generated summary for a story or its duplicates.
+
+    The story's own URL must match with unchanged content; duplicate
+    articles (same story, other outlets) match on URL alone.
+
+    Args:
+        story: Ranked story
+        cache: Summary cache
+
+    Returns:
+        Cached StorySummary or None
+    """
+    keys = [_summary_cache_keys(story)[0]]
+    keys.extend(
+        CompletionCache.make_key({"url": url})
+        for url in story.news_item.duplicates
+    )
+
+    for key in keys:
+        cached = cache.get(key)
+        if cached is None:
+            continue
+
+        try:
+            return _parse_summary_response(_json_loads(cached))
+        except (ValueError, TypeError, AttributeError) as e:
+            # Corrupt or outdated entry; drop it and try the next key
+            logger.warning(f"Discarding unreadable cached summary: {e}")
+            cache.discard(key)
+
+    return None
+
+
+async def summarize_story(
+    story: RankedStory,
+    llm_client: LLMClient,
+    cache: Optional[CompletionCache] = None
 ) -> Optional[StorySummary]:
     """
     Generate summary for a news story using LLM.
@@ -68,12 +138,19 @@ def summarize_story(
     Args:
         story: Ranked story to summarize
         llm_client: LLM client
+        cache: Optional cache of summaries from earlier runs
 
     Returns:
         StorySummary or None if generation fails
     """
     item = story.news_item
 
+    if cache is not None:
+        summary = _cached_summary(story, cache)
+        if summary is not None:
+            logger.info(f"Reusing cached summary: {item.title[:50]}...")
+            return summary
+
     logger.info(f"Summarizing story: {item.title[:50]}...")
 
     try:
@@ -87,11 +164,19 @@ def summarize_story(
         )
 
         # Call LLM
-        response = llm_client.generate_json(prompt)
+        response = await llm_client.agenerate_json(
+            prompt,
+            system_prompt=STORY_SUMMARY_SYSTEM_PROMPT
+        )
 
         # Parse response
         summary = _parse_summary_response(response)
 
+        if cache is not None:
+            serialized = json.dumps(response)
+            for key in _summary_cache_keys(story):
+                cache.set(key, serialized)
+
         logger.info(f"Generated summary with {len(summary.details)} details")
 
         return summary
@@ -111,31 +196,29 @@ def _parse_summary_response(response: dict) -> StorySummary:
     Returns:
         StorySummary object
     """
-    # Parse image suggestion
-    image_data = response.get("image_suggestion", {})
-    image_suggestion = ImageSuggestion(
-        search_keywords=image_data.get("search_keywords", []),
-        credit_line=image_data.get("credit_line", ""),
-        source_url=image_data.get("source_url"),
-        fallback_banner=image_data.get("fallback_banner", False)
-    )
+    # Missing or null fields fall back to empty values
+    image_data = response.get("image_suggestion") or {}
 
-    # Create summary
-    summary = StorySummary(
-        headline=response.get("headline", ""),
-        hook=response.get("hook", ""),
-        details=response.get("details", []),
-        why_it_matters=response.get("why_it_matters", ""),
-        category=response.get("category", "Business"),
-        image_suggestion=image_suggestion
+    return StorySummary(
+        headline=response.get("headline") or "",
+        hook=response.get("hook") or "",
+        details=response.get("details") or [],
+        why_it_matters=response.get("why_it_matters") or "",
+        category=response.get("category") or "Business",
+        image_suggestion=ImageSuggestion(
+            search_keywords=image_data.get("search_keywords") or [],
+            credit_line=image_data.get("credit_line") or "",
+            source_url=image_data.get("source_url"),
+            fallback_banner=bool(image_data.get("fallback_banner"))
+        )
     )
 
-    return summary
-
 
 async def summarize_stories(
     stories: list[RankedStory],
-    llm_client: LLMClient
+    llm_client: LLMClient,
+    max_concurrency: int = 8,
+    cache: Optional[CompletionCache] = None
 ) -> list[RankedStory]:
     """
     Summarize multiple stories. Never drops stories — uses fallback summaries
@@ -144,17 +227,26 @@ async def summarize_stories(
     Args:
         stories: List of ranked stories
         llm_client: LLM client
+        max_concurrency: Maximum LLM requests in flight at once
+        cache: Optional cache of summaries keyed by article URL and content
 
     Returns:
         List of ranked stories with summaries attached (always same length as input)
     """
     logger.info(f"Summarizing {len(stories)} stories")
 
-    llm_success = 0
+    # Requests overlap, so total latency is ~ceil(n / max_concurrency) round trips
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def bounded(story: RankedStory) -> Optional[StorySummary]:
+        async with semaphore:
+            return await summarize_story(story, llm_client, cache)
 
-    for story in stories:
-        summary = summarize_story(story, llm_client)
+    summaries = await asyncio.gather(*(bounded(story) for story in stories))
+
+    llm_success = 0
 
+    for story, summary in zip(stories, summaries):
         if summary:
             story.summary = summary
             llm_success += 1
@@ -181,7 +273,7 @@ def generate_newsletter_intro(
     Returns:
         Introduction text
     """
-    from .prompts import get_newsletter_intro_prompt
+    from .prompts import get_newsletter_intro_prompt, NEWSLETTER_INTRO_SYSTEM_PROMPT
 
     logger.info("Generating newsletter introduction")
 
@@ -193,7 +285,7 @@ def generate_newsletter_intro(
 
     try:
         prompt = get_newsletter_intro_prompt(story_summaries)
-        intro = llm_client.generate(prompt)
+        intro = llm_client.generate(prompt, system_prompt=NEWSLETTER_INTRO_SYSTEM_PROMPT)
 
         logger.info("Generated newsletter introduction")
 
@@ -1,72 +1,136 @@
 """Email delivery for Neural Express newsletters."""
 
+import base64
 import re
 import smtplib
 import os
+from email import encoders
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.mime.application import MIMEApplication
 from pathlib import Path
+from typing import Final
 
 from .logging import get_logger
 
 logger = get_logger("email")
 
 
+# Raw bytes per attachment read; a multiple of 57 so each chunk encodes to
+# whole 76-character base64 lines
+_BASE64_CHUNK_SIZE = 57 * 1024
+
+# Block-level markup, matched against a single line
+_HR_LINE = re.compile(r'---+\s*$')
+_NUMBERED_LINE = re.compile(r'(\d+)\.\s+(.+)$')
+
+# Inline markup, applied within a single line
+_BOLD = re.compile(r'\*\*(.+?)\*\*')
+_ITALIC = re.compile(r'\*(.+?)\*')
+_LINK = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+
+# Markdown syntax removed from the plain text alternative
+_PLAIN_TEXT_STRIP = re.compile(r'\*\*|##|# ')
+
+_HR_HTML = '<hr style="border:none;border-top:2px solid #e0e0e0;margin:24px 0;">'
+_H3_OPEN = '<h3 style="color:#2c3e50;font-size:16px;font-weight:700;margin:20px 0 10px 0;font-family:Arial,Helvetica,sans-serif;">'
+_H2_OPEN = '<h2 style="color:#1a1a2e;font-size:20px;font-weight:700;margin:24px 0 12px 0;border-bottom:2px solid #3498db;padding-bottom:6px;font-family:Arial,Helvetica,sans-serif;">'
+_H1_OPEN = '<h1 style="color:#1a1a2e;font-size:28px;font-weight:800;margin:0 0 8px 0;text-align:center;font-family:Arial,Helvetica,sans-serif;">'
+
+
+# Static document shell around the converted newsletter body
+_HTML_HEAD: Final[str] = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0">
+<title>Neural Express Newsletter</title>
+</head>
+<body style="margin:0;padding:0;background-color:#f4f4f8;font-family:Arial,Helvetica,sans-serif;">
+<table role="presentation" width="100%" cellpadding="0" cellspacing="0" style="background-color:#f4f4f8;">
+<tr><td align="center" style="padding:20px 10px;">
+<table role="presentation" width="640" cellpadding="0" cellspacing="0" style="background-color:#ffffff;border-radius:8px;overflow:hidden;box-shadow:0 2px 8px rgba(0,0,0,0.08);">
+
+<!-- Header Banner -->
+<tr><td style="background:linear-gradient(135deg,#1a1a2e 0%,#16213e 50%,#0f3460 100%);padding:30px 40px;text-align:center;">
+<h1 style="color:#ffffff;font-size:28px;font-weight:800;margin:0;letter-spacing:2px;font-family:Arial,Helvetica,sans-serif;">NEURAL EXPRESS</h1>
+<p style="color:#a0c4ff;font-size:14px;margin:8px 0 0 0;font-family:Arial,Helvetica,sans-serif;">Your AI news briefing curated by intelligent agents</p>
+</td></tr>
+
+<!-- Content -->
+<tr><td style="padding:30px 40px;font-size:14px;color:#333333;line-height:1.7;">
+"""
+
+_HTML_TAIL: Final[str] = """
+</td></tr>
+
+<!-- Footer -->
+<tr><td style="background-color:#f8f9fa;padding:20px 40px;text-align:center;border-top:2px solid #e0e0e0;">
+<p style="color:#888;font-size:12px;margin:0;font-family:Arial,Helvetica,sans-serif;">
+&copy; 2026 Neural Express. All rights reserved.<br>
+Reply to this email with feedback or questions.
+</p>
+</td></tr>
+
+</table>
+</td></tr>
+</table>
+</body>
+</html>"""
+
+
+def _inline_markdown_to_html(text: str) -> str:
+    """Convert bold, italic and link markup within one line."""
+    if "*" in text:
+        text = _BOLD.sub(r'<strong>\1</strong>', text)
+        text = _ITALIC.sub(r'<em style="color:#666;">\1</em>', text)
+    if "[" in text:
+        text = _LINK.sub(
+            r'<a href="\2" style="color:#3498db;text-decoration:none;">\1</a>',
+            text
+        )
+    return text
+
+
 def _markdown_to_html(markdown_text: str) -> str:
     """
     Convert newsletter markdown to styled HTML email.
 
+    Each line is converted in a single pass: block markup is recognized
+    from the line's prefix, and inline regexes only run on lines that
+    contain their marker characters.
+
     Args:
         markdown_text: Raw markdown newsletter content
 
     Returns:
         Fully styled HTML string
     """
-    html = markdown_text
+    result_lines = []
+    in_list = False
+    after_rule = False
 
     # Escape HTML entities (but preserve markdown syntax)
-    html = html.replace("&", "&amp;")
-
-    # Horizontal rules
-    html = re.sub(r'^---+\s*$', '<hr style="border:none;border-top:2px solid #e0e0e0;margin:24px 0;">', html, flags=re.MULTILINE)
-
-    # Headers
-    html = re.sub(
-        r'^### (.+)$',
-        r'<h3 style="color:#2c3e50;font-size:16px;font-weight:700;margin:20px 0 10px 0;font-family:Arial,Helvetica,sans-serif;">\1</h3>',
-        html, flags=re.MULTILINE
-    )
-    html = re.sub(
-        r'^## (.+)$',
-        r'<h2 style="color:#1a1a2e;font-size:20px;font-weight:700;margin:24px 0 12px 0;border-bottom:2px solid #3498db;padding-bottom:6px;font-family:Arial,Helvetica,sans-serif;">\1</h2>',
-        html, flags=re.MULTILINE
-    )
-    html = re.sub(
-        r'^# (.+)$',
-        r'<h1 style="color:#1a1a2e;font-size:28px;font-weight:800;margin:0 0 8px 0;text-align:center;font-family:Arial,Helvetica,sans-serif;">\1</h1>',
-        html, flags=re.MULTILINE
-    )
-
-    # Bold
-    html = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', html)
-
-    # Italic
-    html = re.sub(r'\*(.+?)\*', r'<em style="color:#666;">\1</em>', html)
-
-    # Links: [text](url)
-    html = re.sub(
-        r'\[([^\]]+)\]\(([^)]+)\)',
-        r'<a href="\2" style="color:#3498db;text-decoration:none;">\1</a>',
-        html
-    )
+    for line in markdown_text.replace("&", "&amp;").split("\n"):
+        # Blank lines directly after a horizontal rule are dropped
+        if after_rule:
+            if not line.strip():
+                continue
+            after_rule = False
+
+        if line.startswith("---") and _HR_LINE.match(line):
+            line = _HR_HTML
+            after_rule = True
+        elif line.startswith("### ") and len(line) > 4:
+            line = f"{_H3_OPEN}{_inline_markdown_to_html(line[4:])}</h3>"
+        elif line.startswith("## ") and len(line) > 3:
+            line = f"{_H2_OPEN}{_inline_markdown_to_html(line[3:])}</h2>"
+        elif line.startswith("# ") and len(line) > 2:
+            line = f"{_H1_OPEN}{_inline_markdown_to_html(line[2:])}</h1>"
+        else:
+            line = _inline_markdown_to_html(line)
 
-    # Bullet list items
-    # Collect consecutive bullet lines into <ul> blocks
-    lines = html.split('\n')
-    result_lines = []
-    in_list = False
-    for line in lines:
+        # Collect consecutive bullet lines into <ul> blocks
         stripped = line.strip()
         if stripped.startswith('- '):
             if not in_list:
@@ -79,7 +143,7 @@ def _markdown_to_html(markdown_text: str) -> str:
                 result_lines.append('</ul>')
                 in_list = False
             # Numbered list items
-            num_match = re.match(r'^(\d+)\.\s+(.+)$', stripped)
+            num_match = stripped[:1].isdigit() and _NUMBERED_LINE.match(stripped)
             if num_match:
                 result_lines.append(
                     f'<p style="margin:4px 0 4px 16px;color:#333;line-height:1.6;">'
@@ -94,111 +158,195 @@ def _markdown_to_html(markdown_text: str) -> str:
         result_lines.append('</ul>')
 
     body_content = '\n'.join(result_lines)
-
     # Wrap in full HTML document with inline styles
-    styled_html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-<meta charset="UTF-8">
-<meta name="viewport" content="width=device-width, initial-scale=1.0">
-<title>Neural Express Newsletter</title>
-</head>
-<body style="margin:0;padding:0;background-color:#f4f4f8;font-family:Arial,Helvetica,sans-serif;">
-<table role="presentation" width="100%" cellpadding="0" cellspacing="0" style="background-color:#f4f4f8;">
-<tr><td align="center" style="padding:20px 10px;">
-<table role="presentation" width="640" cellpadding="0" cellspacing="0" style="background-color:#ffffff;border-radius:8px;overflow:hidden;box-shadow:0 2px 8px rgba(0,0,0,0.08);">
+    return _HTML_HEAD + body_content + _HTML_TAIL
 
-<!-- Header Banner -->
-<tr><td style="background:linear-gradient(135deg,#1a1a2e 0%,#16213e 50%,#0f3460 100%);padding:30px 40px;text-align:center;">
-<h1 style="color:#ffffff;font-size:28px;font-weight:800;margin:0;letter-spacing:2px;font-family:Arial,Helvetica,sans-serif;">NEURAL EXPRESS</h1>
-<p style="color:#a0c4ff;font-size:14px;margin:8px 0 0 0;font-family:Arial,Helvetica,sans-serif;">Your AI news briefing curated by intelligent agents</p>
-</td></tr>
 
-<!-- Content -->
-<tr><td style="padding:30px 40px;font-size:14px;color:#333333;line-height:1.7;">
-{body_content}
-</td></tr>
+def render_newsletter_once(body_text: str) -> tuple[str, str]:
+    """
+    Render the plain text and HTML email bodies for a newsletter.
 
-<!-- Footer -->
-<tr><td style="background-color:#f8f9fa;padding:20px 40px;text-align:center;border-top:2px solid #e0e0e0;">
-<p style="color:#888;font-size:12px;margin:0;font-family:Arial,Helvetica,sans-serif;">
-&copy; 2026 Neural Express. All rights reserved.<br>
-Reply to this email with feedback or questions.
-</p>
-</td></tr>
+    Call once per newsletter and pass the results to every
+    send_newsletter_email call instead of re-rendering per recipient.
 
-</table>
-</td></tr>
-</table>
-</body>
-</html>"""
+    Args:
+        body_text: Newsletter markdown content
 
-    return styled_html
+    Returns:
+        Tuple of (plain text, HTML) bodies
+    """
+    # Plain text fallback (strip markdown syntax for readability)
+    plain_text = _PLAIN_TEXT_STRIP.sub("", body_text)
+    return plain_text, _markdown_to_html(body_text)
+
+
+class SMTPSession:
+    """SMTP connection that stays authenticated across several sends."""
+
+    def __init__(self):
+        """Read SMTP server and credentials from the environment."""
+        self.sender_email = os.getenv("EMAIL_SENDER")
+        self.sender_password = os.getenv("EMAIL_PASSWORD")
+        self.smtp_host = os.getenv("EMAIL_SMTP_HOST", "smtp.gmail.com")
+        self.smtp_port = int(os.getenv("EMAIL_SMTP_PORT", "587"))
+        self.server: smtplib.SMTP | None = None
+
+    @property
+    def configured(self) -> bool:
+        """Whether sender credentials are available."""
+        return bool(self.sender_email and self.sender_password)
+
+    def __enter__(self) -> "SMTPSession":
+        self.server = smtplib.SMTP(self.smtp_host, self.smtp_port)
+        try:
+            self.server.starttls()
+            self.server.login(self.sender_email, self.sender_password)
+        except BaseException:
+            self.server.close()
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            self.server.quit()
+        except smtplib.SMTPException:
+            self.server.close()
+        self.server = None
+
+    def send(self, msg: MIMEMultipart, to_addrs: list[str]) -> None:
+        """
+        Send a message over the open connection.
+
+        Args:
+            msg: Message to send
+            to_addrs: Envelope recipients (may differ from the To header)
+        """
+        self.server.send_message(msg, to_addrs=to_addrs)
+
+
+def _encode_pdf(pdf_file: Path) -> MIMEApplication:
+    """
+    Build a base64 PDF part, encoding the file in chunks.
 
+    Avoids holding the raw file and its encoded copy in memory together.
 
-def send_newsletter_email(
+    Args:
+        pdf_file: Path to the PDF file
+
+    Returns:
+        MIME part with the encoded PDF as payload
+    """
+    encoded = bytearray()
+    with open(pdf_file, "rb") as f:
+        while chunk := f.read(_BASE64_CHUNK_SIZE):
+            encoded += base64.encodebytes(chunk)
+
+    attachment = MIMEApplication(
+        encoded.decode("ascii"), _subtype="pdf", _encoder=encoders.encode_noop
+    )
+    attachment["Content-Transfer-Encoding"] = "base64"
+    return attachment
+
+
+def build_pdf_attachment(pdf_path: str) -> MIMEApplication | None:
+    """
+    Build the PDF attachment part for a newsletter.
+
+    The part can be attached to any number of messages, so callers sending
+    the same PDF to several recipients should build it once.
+
+    Args:
+        pdf_path: Path to PDF file to attach
+
+    Returns:
+        Encoded attachment part, or None if the file doesn't exist
+    """
+    pdf_file = Path(pdf_path)
+    if not pdf_file.exists():
+        logger.warning(f"PDF not found, sending without attachment: {pdf_path}")
+        return None
+
+    attachment = _encode_pdf(pdf_file)
+    attachment.add_header(
+        "Content-Disposition",
+        "attachment",
+        filename=pdf_file.name,
+    )
+    logger.info(f"Attached PDF: {pdf_file.name}")
+    return attachment
+
+
+def build_newsletter_message(
+    sender_email: str,
     to_email: str,
     subject: str,
     body_text: str,
     pdf_path: str | None = None,
-) -> bool:
+    plain_text: str | None = None,
+    html_body: str | None = None,
+    attachment: MIMEApplication | None = None,
+) -> MIMEMultipart:
     """
-    Send newsletter email as formatted HTML with optional PDF attachment.
+    Build the newsletter message with optional PDF attachment.
 
     Args:
-        to_email: Recipient email address
+        sender_email: From address
+        to_email: To header value
         subject: Email subject line
         body_text: Newsletter markdown content (will be converted to HTML)
         pdf_path: Path to PDF file to attach (optional)
+        plain_text: Precomputed plain text body from render_newsletter_once
+        html_body: Precomputed HTML body from render_newsletter_once
+        attachment: Prebuilt part from build_pdf_attachment (used instead of pdf_path)
 
     Returns:
-        True if email sent successfully, False otherwise
+        Message ready to send
     """
-    sender_email = os.getenv("EMAIL_SENDER")
-    sender_password = os.getenv("EMAIL_PASSWORD")
-    smtp_host = os.getenv("EMAIL_SMTP_HOST", "smtp.gmail.com")
-    smtp_port = int(os.getenv("EMAIL_SMTP_PORT", "587"))
-
-    if not sender_email or not sender_password:
-        logger.error("EMAIL_SENDER and EMAIL_PASSWORD must be set in environment")
-        return False
-
     msg = MIMEMultipart("alternative")
     msg["From"] = sender_email
     msg["To"] = to_email
     msg["Subject"] = subject
 
-    # Attach plain text fallback (strip markdown syntax for readability)
-    plain_text = body_text.replace("**", "").replace("##", "").replace("# ", "")
-    msg.attach(MIMEText(plain_text, "plain", "utf-8"))
+    if plain_text is None or html_body is None:
+        plain_text, html_body = render_newsletter_once(body_text)
 
-    # Attach HTML version (primary)
-    html_body = _markdown_to_html(body_text)
+    # Attach plain text fallback, then HTML version (primary)
+    msg.attach(MIMEText(plain_text, "plain", "utf-8"))
     msg.attach(MIMEText(html_body, "html", "utf-8"))
 
     # Attach PDF if provided
-    if pdf_path:
-        pdf_file = Path(pdf_path)
-        if pdf_file.exists():
-            with open(pdf_file, "rb") as f:
-                attachment = MIMEApplication(f.read(), _subtype="pdf")
-                attachment.add_header(
-                    "Content-Disposition",
-                    "attachment",
-                    filename=pdf_file.name,
-                )
-                msg.attach(attachment)
-            logger.info(f"Attached PDF: {pdf_file.name}")
-        else:
-            logger.warning(f"PDF not found, sending without attachment: {pdf_path}")
+    if attachment is None and pdf_path:
+        attachment = build_pdf_attachment(pdf_path)
+    if attachment is not None:
+        msg.attach(attachment)
 
-    try:
-        with smtplib.SMTP(smtp_host, smtp_port) as server:
-            server.starttls()
-            server.login(sender_email, sender_password)
-            server.send_message(msg)
+    return msg
 
-        logger.info(f"Newsletter email sent to {to_email}")
+
+def _send_batches(
+    session: SMTPSession | None,
+    msg: MIMEMultipart,
+    batches: list[list[str]]
+) -> bool:
+    """
+    Send a message to each batch of recipients over one SMTP connection.
+
+    Args:
+        session: Open session to reuse, or None to open one for these sends
+        msg: Message to send
+        batches: Envelope recipient lists, one send per list
+
+    Returns:
+        True if every batch was sent, False otherwise
+    """
+    try:
+        if session is not None:
+            for batch in batches:
+                session.send(msg, batch)
+        else:
+            with SMTPSession() as new_session:
+                for batch in batches:
+                    new_session.send(msg, batch)
         return True
 
     except smtplib.SMTPAuthenticationError:
@@ -210,3 +358,91 @@ def send_newsletter_email(
     except Exception as e:
         logger.error(f"Unexpected error sending email: {e}")
         return False
+
+
+def send_newsletter_email(
+    to_email: str,
+    subject: str,
+    body_text: str,
+    pdf_path: str | None = None,
+    plain_text: str | None = None,
+    html_body: str | None = None,
+    session: SMTPSession | None = None,
+    attachment: MIMEApplication | None = None,
+) -> bool:
+    """
+    Send newsletter email as formatted HTML with optional PDF attachment.
+
+    Args:
+        to_email: Recipient email address
+        subject: Email subject line
+        body_text: Newsletter markdown content (will be converted to HTML)
+        pdf_path: Path to PDF file to attach (optional)
+        plain_text: Precomputed plain text body from render_newsletter_once
+        html_body: Precomputed HTML body from render_newsletter_once
+        session: Open SMTPSession to send over (optional; connects per call otherwise)
+        attachment: Prebuilt part from build_pdf_attachment (used instead of pdf_path)
+
+    Returns:
+        True if email sent successfully, False otherwise
+    """
+    sender = session or SMTPSession()
+    if not sender.configured:
+        logger.error("EMAIL_SENDER and EMAIL_PASSWORD must be set in environment")
+        return False
+
+    msg = build_newsletter_message(
+        sender.sender_email, to_email, subject, body_text,
+        pdf_path, plain_text, html_body, attachment
+    )
+
+    if not _send_batches(session, msg, [[to_email]]):
+        return False
+
+    logger.info(f"Newsletter email sent to {to_email}")
+    return True
+
+
+def send_newsletter_broadcast(
+    recipients: list[str],
+    subject: str,
+    body_text: str,
+    pdf_path: str | None = None,
+    batch_size: int = 50,
+) -> bool:
+    """
+    Send one newsletter to many recipients over a single SMTP connection.
+
+    The message is built once and addressed to the sender; recipients only
+    appear in the SMTP envelope (BCC), in batches of batch_size.
+
+    Args:
+        recipients: Recipient email addresses
+        subject: Email subject line
+        body_text: Newsletter markdown content (will be converted to HTML)
+        pdf_path: Path to PDF file to attach (optional)
+        batch_size: Maximum envelope recipients per send
+
+    Returns:
+        True if every batch was sent successfully, False otherwise
+    """
+    if len(recipients) == 1:
+        return send_newsletter_email(recipients[0], subject, body_text, pdf_path)
+
+    session = SMTPSession()
+    if not session.configured:
+        logger.error("EMAIL_SENDER and EMAIL_PASSWORD must be set in environment")
+        return False
+
+    msg = build_newsletter_message(
+        session.sender_email, session.sender_email, subject, body_text, pdf_path
+    )
+    batches = [
+        recipients[i:i + batch_size] for i in range(0, len(recipients), batch_size)
+    ]
+
+    if not _send_batches(None, msg, batches):
+        return False
+
+    logger.info(f"Newsletter email sent to {len(recipients)} recipients")
+    return True
@@ -0,0 +1,51 @@
+"""Shared HTTP client helpers for ingestion."""
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+import httpx
+
+# Connection pool size shared by all ingestion sources
+MAX_CONNECTIONS = 32
+
+# Bytes per chunk handed to streaming parsers (coalesces small HTTP/2 frames)
+STREAM_CHUNK_SIZE = 65536
+
+
+def create_client(timeout: int = 30) -> httpx.AsyncClient:
+    """
+    Create an HTTP/2 client with a pooled connection limit.
+
+    Args:
+        timeout: Default request timeout in seconds
+
+    Returns:
+        AsyncClient to be shared across concurrent fetches
+    """
+    return httpx.AsyncClient(
+        timeout=timeout,
+        http2=True,
+        limits=httpx.Limits(max_connections=MAX_CONNECTIONS)
+    )
+
+
+@asynccontextmanager
+async def client_or_default(
+    client: Optional[httpx.AsyncClient],
+    timeout: int = 30
+) -> AsyncIterator[httpx.AsyncClient]:
+    """
+    Yield the given client, or a short-lived one if none was provided.
+
+    Args:
+        client: Shared client owned by the caller (not closed here)
+        timeout: Request timeout for a newly created client
+
+    Yields:
+        AsyncClient to issue requests with
+    """
+    if client is not None:
+        yield client
+        return
+
+    async with create_client(timeout) as new_client:
+        yield new_client
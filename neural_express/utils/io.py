@@ -8,6 +8,12 @@ from datetime import datetime
 
 from .logging import get_logger
 
+# Prefer orjson's faster serializer when it's installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = get_logger("io")
 
 
@@ -28,8 +34,11 @@ def save_json(data: Any, filepath: Path, indent: int = 2) -> None:
     """
     ensure_dir(filepath.parent)
 
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=indent, default=str)
+    if orjson is not None and indent == 2:
+        filepath.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str))
+    else:
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=indent, default=str)
 
     logger.debug(f"Saved JSON to {filepath}")
 
@@ -48,8 +57,11 @@ def load_json(filepath: Path) -> Any:
         logger.warning(f"JSON file not found: {filepath}")
         return None
 
-    with open(filepath, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    if orjson is not None:
+        data = orjson.loads(filepath.read_bytes())
+    else:
+        with open(filepath, "r", encoding="utf-8") as f:
+            data = json.load(f)
 
     logger.debug(f"Loaded JSON from {filepath}")
     return data
@@ -101,9 +113,7 @@ def save_markdown(content: str, filepath: Path) -> None:
         filepath: Path to save file
     """
     ensure_dir(filepath.parent)
-
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write(content)
+    filepath.write_bytes(content.encode("utf-8"))
 
     logger.info(f"Saved markdown to {filepath}")
 
@@ -1,11 +1,17 @@
 """Structured logging setup for Neural Express."""
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 
+# Background thread that writes queued records to the real handlers
+_listener: Optional[QueueListener] = None
+
 
 def setup_logging(
     level: str = "INFO",
@@ -30,7 +36,8 @@ def setup_logging(
     logger = logging.getLogger("neural_express")
     logger.setLevel(getattr(logging, level.upper()))
 
-    # Clear any existing handlers
+    # Clear any existing handlers (and stop a previous listener)
+    _stop_listener()
     logger.handlers.clear()
 
     # Console handler with colored output
@@ -43,7 +50,7 @@ def setup_logging(
         datefmt="%Y-%m-%d %H:%M:%S"
     )
     console_handler.setFormatter(console_format)
-    logger.addHandler(console_handler)
+    handlers: list[logging.Handler] = [console_handler]
 
     # File handler if specified
     if log_file:
@@ -56,11 +63,31 @@ def setup_logging(
             datefmt="%Y-%m-%d %H:%M:%S"
         )
         file_handler.setFormatter(file_format)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    # Log calls only enqueue records; a listener thread does the stream/file I/O
+    global _listener
+    log_queue: queue.Queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_queue))
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
 
     return logger
 
 
+def _stop_listener() -> None:
+    """Flush queued records and stop the listener thread, if running."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(_stop_listener)
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a child logger with the given name."""
     return logging.getLogger(f"neural_express.{name}")
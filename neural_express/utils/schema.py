@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class NewsItem:
     """Canonical news item schema."""
     id: str                           # stable hash of url
@@ -23,7 +23,7 @@ class NewsItem:
     story_chain_id: Optional[str] = None  # Links related stories across days
 
 
-@dataclass
+@dataclass(slots=True)
 class ImageSuggestion:
     """Image suggestion for a story."""
     search_keywords: list[str]        # 3-6 keywords
@@ -32,7 +32,7 @@ class ImageSuggestion:
     fallback_banner: bool = False     # True if no official source
 
 
-@dataclass
+@dataclass(slots=True)
 class StorySummary:
     """LLM-generated story summary."""
     headline: str                     # refined title
@@ -43,7 +43,7 @@ class StorySummary:
     image_suggestion: ImageSuggestion
 
 
-@dataclass
+@dataclass(slots=True)
 class RankedStory:
     """News item with ranking score."""
     news_item: NewsItem
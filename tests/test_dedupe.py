@@ -1,10 +1,12 @@
 """Tests for deduplication logic."""
 
 import pytest
-from datetime import datetime
+import numpy as np
+from datetime import datetime, timedelta
 from neural_express.utils.schema import NewsItem
 from neural_express.dedupe.embed import EmbeddingModel
 from neural_express.dedupe.dedupe import Deduplicator
+from neural_express.dedupe.cache import EmbeddingCache
 
 
 @pytest.fixture
@@ -111,3 +113,136 @@ def test_select_best_item(embedding_model):
 
     best = dedup._select_best_item(items)
     assert best.id == "2"  # Higher credibility
+
+
+def test_smart_deduplicate_duplicates_and_chains():
+    """Test same-day duplicates are merged and cross-day stories are chained."""
+    now = datetime(2026, 1, 15, 12, 0)
+
+    def make_item(item_id, published_at, credibility):
+        return NewsItem(
+            id=item_id,
+            source="rss",
+            source_name=f"Source {item_id}",
+            title=f"Story {item_id}",
+            url=f"https://example.com/{item_id}",
+            published_at=published_at,
+            author=None,
+            summary_raw="",
+            content_snippet="",
+            engagement={"credibility": credibility}
+        )
+
+    items = [
+        make_item("1", now, 0.85),
+        make_item("2", now + timedelta(hours=1), 0.95),  # same-day duplicate of 1
+        make_item("3", now - timedelta(days=2), 0.90),   # earlier chapter of 1
+        make_item("4", now, 0.90),                       # unrelated
+    ]
+
+    embeddings = np.array([
+        [1.0, 0.0, 0.0],
+        [0.99, 0.14, 0.0],
+        [0.8, 0.6, 0.0],
+        [0.0, 0.0, 1.0],
+    ])
+
+    # Deduplicator only needs the model for embedding; pass embeddings directly
+    dedup = Deduplicator(None, threshold=0.85, story_chain_threshold=0.75)
+    kept = dedup._smart_deduplicate(items, embeddings)
+
+    assert [item.id for item in kept] == ["2", "3", "4"]
+    assert kept[0].duplicates == ["https://example.com/1"]
+    assert kept[0].story_chain_id is not None
+    assert kept[0].story_chain_id == kept[1].story_chain_id
+    assert kept[2].story_chain_id is None
+
+
+def test_cluster_embeddings():
+    """Test clustering links only pairs above the similarity threshold."""
+    embeddings = np.array([
+        [1.0, 0.0, 0.0],
+        [0.99, 0.14, 0.0],
+        [0.0, 0.0, 1.0],
+    ])
+
+    dedup = Deduplicator(None, threshold=0.85)
+    labels = dedup._cluster_embeddings(embeddings)
+
+    assert labels[0] == labels[1]
+    assert labels[2] != labels[0]
+
+
+def test_embedding_cache_roundtrip(tmp_path):
+    """Test embedding cache persists vectors and ignores other models."""
+    cache_path = tmp_path / "embed_cache.npz"
+    cache = EmbeddingCache(cache_path, "model-a")
+    cache.update(["1", "2"], np.array([[1.0, 0.0], [0.0, 1.0]]))
+    cache.save()
+
+    reloaded = EmbeddingCache(cache_path, "model-a")
+    assert "1" in reloaded and "2" in reloaded
+    assert np.allclose(reloaded.get_many(["2", "1"]), [[0.0, 1.0], [1.0, 0.0]])
+
+    other_model = EmbeddingCache(cache_path, "model-b")
+    assert len(other_model) == 0
+
+
+def test_collapse_exact_duplicates():
+    """Test identical reposts collapse before embedding."""
+    def make_item(item_id, title, credibility):
+        return NewsItem(
+            id=item_id,
+            source="rss",
+            source_name=f"Source {item_id}",
+            title=title,
+            url=f"https://example.com/{item_id}",
+            published_at=datetime.now(),
+            author=None,
+            summary_raw="",
+            content_snippet="Same snippet",
+            engagement={"credibility": credibility}
+        )
+
+    items = [
+        make_item("1", "Repost", 0.75),
+        make_item("2", "Repost", 0.95),
+        make_item("3", "Original", 0.85),
+    ]
+
+    dedup = Deduplicator(None)
+    distinct = dedup._collapse_exact_duplicates(items)
+
+    assert [item.id for item in distinct] == ["2", "3"]
+    assert distinct[0].duplicates == ["https://example.com/1"]
+
+
+def test_deduplicate_single_item_skips_embedding():
+    """Test a single item is returned without touching the embedding model."""
+    item = NewsItem(
+        id="1",
+        source="rss",
+        source_name="Source A",
+        title="Only story",
+        url="https://example.com/1",
+        published_at=datetime.now(),
+        author=None,
+        summary_raw="",
+        content_snippet=""
+    )
+
+    dedup = Deduplicator(None)
+    assert dedup.deduplicate([item]) == [item]
+
+
+def test_embedding_cache_keyed_by_text(tmp_path):
+    """Test cached embeddings are shared by identical text and persist."""
+    path = tmp_path / "embed_cache.npz"
+    cache = EmbeddingCache(path, "model")
+    key = cache.make_key("OpenAI Releases GPT-5 Same snippet")
+    cache.update([key], np.ones((1, 4), dtype=np.float32))
+    cache.save()
+
+    assert EmbeddingCache.make_key("OpenAI Releases GPT-5 Same snippet") == key
+    assert key in EmbeddingCache(path, "model")
+    assert key not in EmbeddingCache(path, "other-model")
@@ -8,8 +8,10 @@ from neural_express.rank.score import (
     calculate_credibility_score,
     calculate_uniqueness_score,
     calculate_relevance_score,
-    calculate_composite_score
+    calculate_composite_score,
+    calculate_composite_scores
 )
+from neural_express.rank.select import rank_stories
 
 
 def test_recency_score_recent():
@@ -163,3 +165,107 @@ def test_composite_score():
         "uniqueness_score",
         "relevance_score"
     ])
+
+
+def test_recency_score_reference_time():
+    """Test recency score against an explicit reference time."""
+    published = datetime(2024, 1, 1, 12, 0)
+    item = NewsItem(
+        id="1",
+        source="rss",
+        source_name="Test",
+        title="Test",
+        url="https://example.com",
+        published_at=published,
+        author=None,
+        summary_raw="",
+        content_snippet=""
+    )
+
+    inside = calculate_recency_score(item, 24, now=published + timedelta(hours=23))
+    outside = calculate_recency_score(item, 24, now=published + timedelta(hours=48))
+
+    assert inside == 1.0
+    assert outside < 1.0
+
+
+def test_composite_scores_match_per_item():
+    """Test vectorized scores against per-item scoring."""
+    now = datetime(2024, 1, 2, 12, 0)
+    items = [
+        NewsItem(
+            id=str(i),
+            source="rss",
+            source_name="Test",
+            title=title,
+            url=f"https://example.com/{i}",
+            published_at=now - timedelta(hours=hours),
+            author=None,
+            summary_raw="",
+            content_snippet="Deep learning research",
+            engagement={"credibility": 0.6 + 0.1 * i},
+            duplicates=["dup"] * i
+        )
+        for i, (title, hours) in enumerate([
+            ("New LLM release", 2),
+            ("Transformer training tricks", 30),
+            ("Markets update", 100)
+        ])
+    ]
+    weights = {"recency": 0.3, "credibility": 0.25, "engagement": 0.15,
+               "uniqueness": 0.15, "relevance": 0.15}
+    keywords = ["llm", "transformer", "deep learning", "ai"]
+
+    scores = calculate_composite_scores(items, weights, 24, keywords, now=now)
+
+    for i, item in enumerate(items):
+        expected = calculate_composite_score(item, weights, 24, keywords, now=now)
+        for name, value in expected.items():
+            assert scores[name][i] == pytest.approx(value)
+
+
+def test_relevance_score_overlapping_keywords():
+    """Test that keywords contained in other keywords are all counted."""
+    item = NewsItem(
+        id="1",
+        source="rss",
+        source_name="Test",
+        title="Neural network pruning",
+        url="https://example.com",
+        published_at=datetime.now(),
+        author=None,
+        summary_raw="",
+        content_snippet=""
+    )
+
+    keywords = ["neural network", "network", "net", "llm"]
+
+    # 3 of 4 keywords present -> density 0.75, doubled and capped at 1.0
+    assert calculate_relevance_score(item, keywords) == 1.0
+    assert calculate_relevance_score(item, ["network", "llm", "ai", "gpu"]) == 0.5
+
+
+def test_rank_stories_limit():
+    """Test that a limited ranking is the prefix of the full ranking."""
+    now = datetime.now()
+    items = [
+        NewsItem(
+            id=str(i),
+            source="rss",
+            source_name="Test",
+            title="AI news",
+            url=f"https://example.com/{i}",
+            published_at=now - timedelta(hours=12 * (i % 4)),
+            author=None,
+            summary_raw="",
+            content_snippet="",
+            engagement={"credibility": 0.5 + 0.1 * (i % 3)}
+        )
+        for i in range(12)
+    ]
+
+    full = rank_stories(items, {}, 24, ["ai"])
+    top = rank_stories(items, {}, 24, ["ai"], limit=5)
+
+    assert [s.news_item.id for s in top] == [s.news_item.id for s in full[:5]]
+    assert rank_stories(items, {}, 24, ["ai"], limit=0) == []
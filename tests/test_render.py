@@ -1,13 +1,17 @@
 """Tests for rendering logic."""
 
 import pytest
+import xml.etree.ElementTree as ET
 from datetime import datetime
+from neural_express.ingestion.arxiv import _parse_arxiv_entry, ATOM_NAMESPACE
 from neural_express.utils.schema import NewsItem, RankedStory, StorySummary, ImageSuggestion
 from neural_express.render.beehiiv_md import render_newsletter
 from neural_express.render.templates import (
     get_category_emoji,
     format_details_list,
-    format_source_list
+    format_source_list,
+    compile_template,
+    MAIN_STORY_TEMPLATE
 )
 
 
@@ -42,6 +46,33 @@ def test_format_source_list():
     assert "(https://techcrunch.com/article1)" in formatted
 
 
+def test_compile_template():
+    """Test compiled templates render like str.format."""
+    fields = {
+        "story_number": 1,
+        "category_emoji": "🔬",
+        "headline": "Headline {with braces}",
+        "category": "Research",
+        "source": "TechCrunch",
+        "hook": "Hook",
+        "details": "- Detail 1",
+        "why_it_matters": "Because",
+        "url": "https://example.com"
+    }
+
+    render = compile_template(MAIN_STORY_TEMPLATE)
+    assert render(**fields) == MAIN_STORY_TEMPLATE.format(**fields)
+    assert compile_template("{{literal}} {x}")(x=1) == "{literal} 1"
+
+    assert compile_template("{str}")(str=1) == "{str}".format(str=1)
+    assert compile_template("{_str} {str}")(_str=1, str=2) == "1 2"
+
+    with pytest.raises(ValueError):
+        compile_template("{x:>5}")
+    with pytest.raises(ValueError):
+        compile_template("{class}")
+
+
 def test_render_newsletter():
     """Test complete newsletter rendering."""
     # Create sample story
@@ -97,3 +128,154 @@ def test_render_newsletter():
     assert "Detail 1" in newsletter
     assert "https://example.com/article" in newsletter
     assert "TechCrunch" in newsletter
+
+
+def test_render_newsletter_render_time():
+    """Test that the header date comes from render_time."""
+    newsletter = render_newsletter(
+        top_stories=[],
+        secondary_stories=[],
+        intro="Intro",
+        mode="daily",
+        render_time=datetime(2024, 3, 5)
+    )
+
+    assert "*March 05, 2024*" in newsletter
+
+
+def test_render_newsletter_mixed_source_chain():
+    """Test a weekly chain can order arXiv papers alongside RSS items."""
+    entry = ET.fromstring(
+        '<entry xmlns="http://www.w3.org/2005/Atom">'
+        "<id>http://arxiv.org/abs/2403.00001v1</id>"
+        "<title>A New Model</title>"
+        "<summary>Abstract</summary>"
+        "<published>2024-03-02T18:00:00Z</published>"
+        "</entry>"
+    )
+    paper = _parse_arxiv_entry(entry, ATOM_NAMESPACE)
+    article = NewsItem(
+        id="rss-1",
+        source="rss",
+        source_name="TechCrunch",
+        title="Lab Teases A New Model",
+        url="https://example.com/teaser",
+        published_at=datetime(2024, 3, 1, 9, 0),
+        author=None,
+        summary_raw="Summary",
+        content_snippet="Snippet"
+    )
+    chain = [
+        RankedStory(
+            news_item=item,
+            score=0.5,
+            recency_score=1.0,
+            credibility_score=0.5,
+            engagement_score=0.5,
+            uniqueness_score=1.0,
+            relevance_score=0.5
+        )
+        for item in (paper, article)
+    ]
+
+    newsletter = render_newsletter(
+        top_stories=[],
+        secondary_stories=[],
+        intro="Intro",
+        mode="weekly",
+        story_chains={"chain": chain},
+        render_time=datetime(2024, 3, 5)
+    )
+
+    assert paper.published_at == datetime(2024, 3, 2, 18, 0)
+    timeline = newsletter.index("Lab Teases A New Model *(TechCrunch)*")
+    assert timeline < newsletter.index("A New Model *(arXiv)*")
+
+
+def test_export_to_pdf_escapes_markup(tmp_path):
+    """Test that markup characters in story text don't break the PDF build."""
+    from neural_express.render.pdf_export import export_to_pdf
+
+    item = NewsItem(
+        id="1",
+        source="rss",
+        source_name="R&D <Weekly>",
+        title="Chips <b>& boards",
+        url="https://example.com/article",
+        published_at=datetime(2024, 3, 5),
+        author=None,
+        summary_raw="Summary & <more>",
+        content_snippet="Snippet with <unclosed tag"
+    )
+    story = RankedStory(
+        news_item=item,
+        score=0.9,
+        recency_score=1.0,
+        credibility_score=0.85,
+        engagement_score=0.5,
+        uniqueness_score=1.0,
+        relevance_score=0.9
+    )
+
+    output_path = tmp_path / "newsletter.pdf"
+    export_to_pdf([story], [story], "Intro", output_path, render_time=datetime(2024, 3, 5))
+
+    assert output_path.stat().st_size > 0
+
+
+def test_export_to_pdf_bytes():
+    """Test building the PDF in memory."""
+    from neural_express.render.pdf_export import export_to_pdf_bytes
+
+    data = export_to_pdf_bytes([], [], "Intro", render_time=datetime(2024, 3, 5))
+
+    assert data.startswith(b"%PDF")
+
+
+def _pdf_story(index: int, n_details: int, words: int) -> RankedStory:
+    """Build a summarized story whose text length scales with words."""
+    item = NewsItem(
+        id=str(index),
+        source="rss",
+        source_name=f"Source {index}",
+        title=f"Title {index}",
+        url=f"https://example.com/{index}",
+        published_at=datetime(2024, 3, 1),
+        author=None,
+        summary_raw="Summary",
+        content_snippet="Snippet"
+    )
+    summary = StorySummary(
+        headline=f"Headline {index}",
+        hook=" ".join(["hook"] * words),
+        details=[f"Detail {d} " + "word " * words for d in range(n_details)],
+        why_it_matters="Because " + "it " * words,
+        category="Research",
+        image_suggestion=ImageSuggestion(search_keywords=["ai"], credit_line="Credit")
+    )
+    return RankedStory(
+        news_item=item,
+        score=0.9,
+        recency_score=1.0,
+        credibility_score=0.85,
+        engagement_score=0.5,
+        uniqueness_score=1.0,
+        relevance_score=0.9,
+        summary=summary
+    )
+
+
+def test_export_to_pdf_multi_page_layouts():
+    """Test long newsletters build whatever falls at the bottom of a page."""
+    from neural_express.render.pdf_export import export_to_pdf_bytes
+
+    # Varying lengths shift dividers onto page breaks in different issues
+    for n in range(60):
+        top = [_pdf_story(j, 3 + (n + j) % 4, 5 + (n * 7 + j * 3) % 30) for j in range(5)]
+        secondary = [_pdf_story(10 + j, 1, 5 + (n + j) % 20) for j in range(3 + n % 5)]
+
+        data = export_to_pdf_bytes(
+            top, secondary, "Intro " * (n % 40), render_time=datetime(2024, 3, 5)
+        )
+
+        assert data.startswith(b"%PDF")
@@ -0,0 +1,153 @@
+"""Tests for summarization pipeline."""
+
+import asyncio
+import json
+from datetime import datetime
+from types import SimpleNamespace
+from neural_express.utils.schema import NewsItem, RankedStory
+from neural_express.summarize.cache import CompletionCache
+from neural_express.summarize.llm import LLMClient
+from neural_express.summarize.summarize import summarize_stories
+
+
+class FakeLLMClient:
+    """Stand-in LLM client that records how many requests overlap."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def agenerate_json(self, prompt: str, system_prompt=None) -> dict:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+
+        if "Broken" in prompt:
+            raise json.JSONDecodeError("Expecting value", "", 0)
+
+        title = prompt.split("Title: ", 1)[1].split("\n", 1)[0]
+        return {"headline": f"Summary of {title}", "details": ["One", "Two", "Three"]}
+
+
+def _story(title: str) -> RankedStory:
+    item = NewsItem(
+        id=title,
+        source="rss",
+        source_name="Test",
+        title=title,
+        url=f"https://example.com/{title}",
+        published_at=datetime(2024, 3, 5),
+        author=None,
+        summary_raw="Summary",
+        content_snippet="Content"
+    )
+    return RankedStory(
+        news_item=item,
+        score=0.5,
+        recency_score=0.5,
+        credibility_score=0.5,
+        engagement_score=0.5,
+        uniqueness_score=0.5,
+        relevance_score=0.5
+    )
+
+
+def test_summarize_stories_concurrent():
+    """Test that summaries are requested concurrently and kept in order."""
+    stories = [_story(f"Story{i}") for i in range(5)] + [_story("Broken")]
+    client = FakeLLMClient()
+
+    result = asyncio.run(summarize_stories(stories, client, max_concurrency=3))
+
+    assert client.max_in_flight == 3
+    assert [s.summary.headline for s in result[:5]] == [
+        f"Summary of Story{i}" for i in range(5)
+    ]
+    # Failed request falls back to raw item data
+    assert result[5].summary.headline == "Broken"
+
+
+def test_completion_cache_roundtrip(tmp_path):
+    """Test that completions persist across loads and expire after the TTL."""
+    path = tmp_path / "llm_cache.pkl"
+    key = CompletionCache.make_key({"model": "m", "messages": [{"content": "hi"}]})
+
+    cache = CompletionCache(path)
+    cache.set(key, "hello")
+    cache.save()
+
+    assert CompletionCache(path).get(key) == "hello"
+    assert CompletionCache(path, ttl_seconds=-1).get(key) is None
+
+
+def test_llm_client_uses_cache(tmp_path):
+    """Test that a repeated request is served from the completion cache."""
+    calls = []
+
+    async def create(**request):
+        calls.append(request)
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content='{"a": 1}'))],
+            usage=SimpleNamespace(total_tokens=5)
+        )
+
+    client = LLMClient(api_key="test", cache=CompletionCache(tmp_path / "llm_cache.pkl"))
+    client._create_async_client = lambda: SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+    )
+
+    first = asyncio.run(client.agenerate_json("prompt"))
+    second = asyncio.run(client.agenerate_json("prompt"))
+
+    assert first == second == {"a": 1}
+    assert len(calls) == 1
+
+
+def test_summarize_stories_reuses_cached_summaries(tmp_path):
+    """Test that summaries are reused for the same article and its duplicates."""
+    cache = CompletionCache(tmp_path / "llm_cache.pkl")
+    client = FakeLLMClient()
+    first = asyncio.run(summarize_stories([_story("Story0")], client, cache=cache))
+
+    # Same article again, and another outlet's copy listing it as a duplicate
+    duplicate = _story("Story1")
+    duplicate.news_item.duplicates = [first[0].news_item.url]
+    client = FakeLLMClient()
+    result = asyncio.run(summarize_stories([_story("Story0"), duplicate], client, cache=cache))
+
+    assert client.max_in_flight == 0
+    assert [s.summary.headline for s in result] == ["Summary of Story0"] * 2
+
+
+def test_llm_client_async_client_per_event_loop():
+    """Test that each event loop gets its own async client."""
+    client = LLMClient(api_key="test")
+
+    async def get_client():
+        # Same loop, same client
+        assert client.async_client is client.async_client
+        return client.async_client
+
+    first = asyncio.run(get_client())
+    second = asyncio.run(get_client())
+
+    assert first is not second
+
+
+def test_summarize_stories_discards_corrupt_cached_summary(tmp_path):
+    """Test that an unreadable cache entry is dropped and re-summarized."""
+    cache = CompletionCache(tmp_path / "llm_cache.pkl")
+    story = _story("Story0")
+    story.news_item.duplicates = ["https://example.com/dup"]
+    own_key = CompletionCache.make_key({"url": story.news_item.url, "content": "Content"})
+    duplicate_key = CompletionCache.make_key({"url": "https://example.com/dup"})
+    cache.set(own_key, "{not json")
+    cache.set(duplicate_key, "[1, 2]")
+
+    client = FakeLLMClient()
+    result = asyncio.run(summarize_stories([story], client, cache=cache))
+
+    assert client.max_in_flight == 1
+    assert result[0].summary.headline == "Summary of Story0"
+    assert cache.get(duplicate_key) is None